@@ -1,5 +1,7 @@
 """SPC-style colormaps for weather visualization"""
 
+from functools import lru_cache
+
 from matplotlib.colors import LinearSegmentedColormap
 
 
@@ -153,4 +155,14 @@ def create_all_colormaps():
                           '#0868ac', '#084081', '#081d58']  # 4+°C/hr: deep blues (rapid)
     colormaps['CoolingRate'] = LinearSegmentedColormap.from_list('CoolingRate', cooling_rate_colors)
 
-    return colormaps
\ No newline at end of file
+    return colormaps
+
+
+@lru_cache(maxsize=1)
+def _cached_colormaps():
+    return create_all_colormaps()
+
+
+def get_colormap(name):
+    """Return a named colormap, built once per process and reused across renders"""
+    return _cached_colormaps()[name]
@@ -25,14 +25,22 @@ Usage:
 
 import numpy as np
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple, List, Union
 from dataclasses import dataclass, field
 import warnings
 import time
+import hashlib
+import math
+import threading
+from functools import lru_cache
+from operator import itemgetter
 import io
 
+if TYPE_CHECKING:
+    from PIL import Image
 
-@dataclass
+
+@dataclass(slots=True)
 class ForecastHourData:
     """Holds all pre-loaded data for a single forecast hour."""
     forecast_hour: int
@@ -77,13 +85,14 @@ class ForecastHourData:
         manages their physical memory, not the Python heap.
         """
         total = 0
-        for name, val in self.__dict__.items():
+        for name in self.__slots__:
+            val = getattr(self, name)
             if isinstance(val, np.ndarray) and not isinstance(val, np.memmap):
                 total += val.nbytes
         return total / 1024 / 1024
 
 
-@dataclass
+@dataclass(slots=True)
 class ClimatologyData:
     """Holds coarsened climatology grid for anomaly computation."""
     month: int
@@ -115,6 +124,35 @@ ANOMALY_STYLES = {
 }
 
 
+
+def _stull_wetbulb(t_c: np.ndarray, rh: np.ndarray) -> np.ndarray:
+    """Stull (2011) wet-bulb temperature (°C) from T (°C) and RH (%).
+
+    Evaluated with in-place accumulation into one output array, so a full
+    section costs a couple of temporaries instead of one per term.
+    """
+    tw = np.arctan(0.151977 * np.sqrt(rh + 8.313659))
+    tw *= t_c
+    tw += np.arctan(t_c + rh)
+    tw -= np.arctan(rh - 1.676331)
+    tw += 0.00391838 * (rh * np.sqrt(rh)) * np.arctan(0.023101 * rh)
+    tw -= 4.686035
+    return tw
+
+
+def _tetens_vpd(t_c: np.ndarray, rh: np.ndarray) -> np.ndarray:
+    """Vapor pressure deficit (hPa) from T (°C) and RH (%) via Tetens.
+
+    The whole expression is evaluated in one buffer with in-place ufuncs.
+    """
+    vpd = t_c + 237.3
+    np.divide(t_c, vpd, out=vpd)
+    vpd *= 17.27
+    np.exp(vpd, out=vpd)
+    vpd *= 6.1078
+    vpd *= 1.0 - rh * 0.01
+    return vpd
+
 # GFS CONUS subset bounds (CONUS_BOUNDS ± 5° padding)
 # Subsetting at extraction time reduces GFS from 721x1440 global → ~166x333 CONUS,
 # cutting cache from ~500MB to ~50MB per FHR and RAM from ~8GB to ~1.5GB.
@@ -123,6 +161,14 @@ GFS_CONUS_SUBSET = {
     'west': -139.10, 'east': -55.92,
 }
 
+# Idle render Figures (each holding a full-size Agg buffer), shared by every
+# InteractiveCrossSection in the process. Sized to the dashboard's render
+# concurrency across all models (RENDER_SEMAPHORE), so idle canvases never
+# outnumber the renders that can actually run at once.
+FIG_POOL_SIZE = 12
+_fig_pool: List[Any] = []
+_fig_pool_lock = threading.Lock()
+
 
 def _subset_to_conus(fhr_data: ForecastHourData) -> ForecastHourData:
     """Subset a GFS ForecastHourData from global 0.25° grid to CONUS region.
@@ -266,7 +312,7 @@ def _load_hour_process(
                 backend_kwargs={'indexpath': ''},
             )
 
-            var_name = list(ds_t.data_vars)[0]
+            var_name = next(iter(ds_t.data_vars))
             t_data = ds_t[var_name]
 
             if 'isobaricInhPa' in t_data.dims:
@@ -301,7 +347,7 @@ def _load_hour_process(
                         backend_kwargs={'indexpath': ''},
                     )
                     if ds and len(ds.data_vars) > 0:
-                        setattr(data, field_name, ds[list(ds.data_vars)[0]].values)
+                        setattr(data, field_name, ds[next(iter(ds.data_vars))].values)
                     ds.close()
                 except Exception:
                     pass
@@ -313,10 +359,10 @@ def _load_hour_process(
                     backend_kwargs={'indexpath': ''},
                 )
                 if ds_sp and len(ds_sp.data_vars) > 0:
-                    sp_data = ds_sp[list(ds_sp.data_vars)[0]].values
+                    sp_data = ds_sp[next(iter(ds_sp.data_vars))].values
                     while sp_data.ndim > 2:
                         sp_data = sp_data[0]
-                    if np.isfinite(sp_data).any() and np.nanmax(sp_data) > 2000:
+                    if np.any(sp_data > 2000):
                         sp_data = sp_data / 100.0
                     data.surface_pressure = sp_data
                 ds_sp.close()
@@ -332,21 +378,25 @@ def _load_hour_process(
         by_level = {k: {} for k in target_keys}
         lats = None
         lons = None
+        # Bound once: the scan visits every message in the file
+        new_from_file = eccodes.codes_grib_new_from_file
+        codes_get = eccodes.codes_get
+        codes_release = eccodes.codes_release
 
         with open(grib_file, 'rb') as f:
             while True:
-                msg = eccodes.codes_grib_new_from_file(f)
+                msg = new_from_file(f)
                 if msg is None:
                     break
                 try:
-                    ltype = eccodes.codes_get(msg, 'typeOfLevel')
+                    ltype = codes_get(msg, 'typeOfLevel')
                     if ltype != 'isobaricInhPa':
                         continue
-                    short_name = eccodes.codes_get(msg, 'shortName')
+                    short_name = codes_get(msg, 'shortName')
                     if short_name not in target_keys:
                         continue
 
-                    level = int(eccodes.codes_get(msg, 'level'))
+                    level = int(codes_get(msg, 'level'))
                     arr2d = _decode_msg_to_2d(msg).astype(np.float32, copy=False)
                     by_level[short_name][level] = arr2d
 
@@ -356,7 +406,7 @@ def _load_hour_process(
                         lats = lat_vals.reshape(arr2d.shape)
                         lons = lon_vals.reshape(arr2d.shape)
                 finally:
-                    eccodes.codes_release(msg)
+                    codes_release(msg)
 
         t_levels = by_level.get('t', {})
         if not t_levels:
@@ -370,7 +420,7 @@ def _load_hour_process(
 
         if lats is None or lons is None:
             raise RuntimeError("missing lat/lon grid")
-        if np.isfinite(lons).any() and np.nanmax(lons) > 180:
+        if np.any(lons > 180):
             lons = np.where(lons > 180, lons - 360, lons)
 
         def _stack(short_name: str) -> Optional[np.ndarray]:
@@ -406,7 +456,7 @@ def _load_hour_process(
                     ltype = eccodes.codes_get(msg, 'typeOfLevel')
                     if short_name == 'sp' and ltype == 'surface':
                         sp_data = _decode_msg_to_2d(msg).astype(np.float32, copy=False)
-                        if np.isfinite(sp_data).any() and np.nanmax(sp_data) > 2000:
+                        if np.any(sp_data > 2000):
                             sp_data = sp_data / 100.0
                         data.surface_pressure = sp_data
                         break
@@ -471,7 +521,7 @@ def _load_hour_process(
 
                 if smoke_levels and pres_levels_hyb:
                     levels_sorted = sorted(smoke_levels.keys())
-                    ny, nx = list(smoke_levels.values())[0].shape
+                    ny, nx = next(iter(smoke_levels.values())).shape
                     n_hyb = len(levels_sorted)
                     smoke_hyb = np.zeros((n_hyb, ny, nx), dtype=np.float32)
                     pres_hyb = np.zeros((n_hyb, ny, nx), dtype=np.float32)
@@ -508,28 +558,47 @@ class InteractiveCrossSection:
 
     # Cached cartopy feature geometries (class-level, parsed once per process)
     _cartopy_features_cache = None
+    _cartopy_features_lock = threading.Lock()
 
     @classmethod
     def _get_cartopy_features(cls):
         """Load and cache cartopy feature geometries once per process.
 
         Parsing Natural Earth shapefiles takes ~2.5s. By caching the resolved
-        geometry lists, subsequent renders skip all shapefile I/O.
+        geometry lists, subsequent renders skip all shapefile I/O. The lock
+        keeps concurrent first renders from each parsing the shapefiles.
         """
         if cls._cartopy_features_cache is not None:
             return cls._cartopy_features_cache
 
-        import cartopy.feature as cfeature
-        cls._cartopy_features_cache = {
-            'land': list(cfeature.LAND.geometries()),
-            'ocean': list(cfeature.OCEAN.geometries()),
-            'lakes': list(cfeature.LAKES.geometries()),
-            'states': list(cfeature.STATES.geometries()),
-            'borders': list(cfeature.BORDERS.geometries()),
-            'coastline': list(cfeature.COASTLINE.geometries()),
-        }
+        with cls._cartopy_features_lock:
+            if cls._cartopy_features_cache is None:
+                import cartopy.feature as cfeature
+                cls._cartopy_features_cache = {
+                    'land': list(cfeature.LAND.geometries()),
+                    'ocean': list(cfeature.OCEAN.geometries()),
+                    'lakes': list(cfeature.LAKES.geometries()),
+                    'states': list(cfeature.STATES.geometries()),
+                    'borders': list(cfeature.BORDERS.geometries()),
+                    'coastline': list(cfeature.COASTLINE.geometries()),
+                }
         return cls._cartopy_features_cache
 
+    @classmethod
+    def warmup(cls):
+        """Pay one-time render setup costs up front (e.g. at server startup).
+
+        Parses the inset-map shapefiles and imports matplotlib's Agg backend so
+        the first user-facing render doesn't absorb several seconds of latency.
+        """
+        import matplotlib
+        matplotlib.use('Agg')
+        from matplotlib.figure import Figure  # noqa: F401
+        try:
+            cls._get_cartopy_features()
+        except Exception as e:
+            print(f"Cartopy warmup skipped: {e}")
+
     # Fields to pre-load (covers all styles including hydrometeors)
     FIELDS_TO_LOAD = {
         't': 'temperature',
@@ -550,6 +619,9 @@ class InteractiveCrossSection:
 
     CACHE_LIMIT_GB = 1000  # Max cache size on disk
 
+    # zlib level for rendered PNGs (Pillow default is 6). Flat-shaded sections
+    # compress nearly as well at 3 and encode noticeably faster.
+    PNG_COMPRESS_LEVEL = 3
     SUPPORTED_GRIB_BACKENDS = {'cfgrib', 'eccodes', 'auto'}
 
     def __init__(self, cache_dir: str = None, min_levels: int = 40,
@@ -568,6 +640,12 @@ class InteractiveCrossSection:
         self.forecast_hours: Dict[int, ForecastHourData] = {}
         self._kdtree_cache = None  # Cached cKDTree for curvilinear grid interpolation
         self._kdtree_grid_id = None  # id() of the lats array used to build the tree
+        # Grid fingerprint -> (lats, lons) shared by every FHR on that grid, so
+        # coordinates are held once and the KD-tree above stays valid across FHRs
+        self._grid_cache: Dict[tuple, Tuple[np.ndarray, np.ndarray]] = {}
+        # eccodes md5GridSection -> the same shared (lats, lons), so the eccodes
+        # loader can skip decoding coordinates without a second key scheme
+        self._gds_grids: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
         self.cache_dir = Path(cache_dir) if cache_dir else None
         if self.cache_dir:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -670,7 +748,7 @@ class InteractiveCrossSection:
                 return
 
             target_gb = self.CACHE_LIMIT_GB * 0.85
-            entries.sort(key=lambda e: e[2])  # oldest access first
+            entries.sort(key=itemgetter(2))  # oldest access first
             for path, size_bytes, _ in entries:
                 if total_gb <= target_gb:
                     break
@@ -766,22 +844,17 @@ class InteractiveCrossSection:
                 if arr is not None:
                     np.save(tmp_dir / f'{field_name}.npy', arr)
 
-            # Save float16 fields
+            # Save float16 fields (single cast; no copy if already float16)
             for field_name in self._FLOAT16_FIELDS:
                 arr = getattr(fhr_data, field_name, None)
                 if arr is not None:
-                    # Read from mmap if needed before converting
-                    if isinstance(arr, np.memmap):
-                        arr = np.array(arr)
-                    np.save(tmp_dir / f'{field_name}.npy', arr.astype(np.float16))
+                    np.save(tmp_dir / f'{field_name}.npy', np.asarray(arr, dtype=np.float16))
 
             # Save float32 fields
             for field_name in self._FLOAT32_FIELDS:
                 arr = getattr(fhr_data, field_name, None)
                 if arr is not None:
-                    if isinstance(arr, np.memmap):
-                        arr = np.array(arr)
-                    np.save(tmp_dir / f'{field_name}.npy', arr.astype(np.float32))
+                    np.save(tmp_dir / f'{field_name}.npy', np.asarray(arr, dtype=np.float32))
 
             # Write _complete marker last — cache only valid if this exists
             (tmp_dir / '_complete').touch()
@@ -798,10 +871,27 @@ class InteractiveCrossSection:
                 shutil.rmtree(tmp_dir)
             raise e
 
+    def _share_grid(self, lats: np.ndarray, lons: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return canonical lat/lon arrays for this grid, shared across FHRs.
+
+        Every loader keys grids by this coordinate hash, so the same grid maps
+        to one entry whichever path loaded it. Arrays that are already
+        canonical (e.g. eccodes hits via md5GridSection) pass straight through
+        without rehashing.
+        """
+        for grid in self._grid_cache.values():
+            if lats is grid[0] and lons is grid[1]:
+                return grid
+        digest = hashlib.blake2b(np.ascontiguousarray(lats).view(np.uint8), digest_size=16)
+        digest.update(np.ascontiguousarray(lons).view(np.uint8))
+        key = (lats.shape, lats.dtype.str, digest.hexdigest())
+        return self._grid_cache.setdefault(key, (lats, lons))
+
     def _load_from_mmap_cache(self, cache_dir: Path) -> Optional[ForecastHourData]:
         """Load ForecastHourData with memory-mapped .npy files.
 
-        Coordinate arrays (pressure_levels, lats, lons) are loaded into RAM (~30KB).
+        Coordinate arrays (pressure_levels, lats, lons) are loaded into RAM; lat/lon
+        are deduplicated against the grid cache so all FHRs share one copy.
         All 3D fields are opened with mmap_mode='r' — just file handles, no data read.
         Actual data is read from NVMe on demand when cross-section slices specific levels.
         """
@@ -814,8 +904,8 @@ class InteractiveCrossSection:
 
             # Coordinate arrays: load fully into RAM (tiny)
             pressure_levels = np.load(cache_dir / 'pressure_levels.npy')
-            lats = np.load(cache_dir / 'lats.npy')
-            lons = np.load(cache_dir / 'lons.npy')
+            lats, lons = self._share_grid(np.load(cache_dir / 'lats.npy'),
+                                          np.load(cache_dir / 'lons.npy'))
 
             fhr_data = ForecastHourData(
                 forecast_hour=forecast_hour,
@@ -891,7 +981,7 @@ class InteractiveCrossSection:
 
         # Build sorted 3D arrays (sorted by hybrid level number)
         levels_sorted = sorted(smoke_levels.keys())
-        ny, nx = list(smoke_levels.values())[0].shape
+        ny, nx = next(iter(smoke_levels.values())).shape
         n_hyb = len(levels_sorted)
 
         smoke_hyb = np.zeros((n_hyb, ny, nx), dtype=np.float32)
@@ -940,8 +1030,7 @@ class InteractiveCrossSection:
             if result is None:
                 return
             smoke_hyb, smoke_pres_hyb = result
-            print(f"  Loaded PM2.5 smoke on {smoke_hyb.shape[0]} hybrid levels "
-                  f"(max={np.nanmax(smoke_hyb):.1f} μg/m³)")
+            print(f"  Loaded PM2.5 smoke on {smoke_hyb.shape[0]} hybrid levels")
             # For mmap caches, write smoke .npy files directly into the cache dir
             if mmap_cache_dir and mmap_cache_dir.is_dir():
                 np.save(mmap_cache_dir / 'smoke_hyb.npy', smoke_hyb.astype(np.float16))
@@ -988,39 +1077,53 @@ class InteractiveCrossSection:
         fields_by_level = {k: {} for k in target_keys}  # shortName -> level -> 2D array
         lats = None
         lons = None
+        grid_id = None
         scanned = 0
         matched = 0
+        # Bound once: the scan visits every message in the file
+        new_from_file = eccodes.codes_grib_new_from_file
+        codes_get = eccodes.codes_get
+        codes_release = eccodes.codes_release
+        msg_to_2d = self._grib_msg_to_2d
 
         with open(grib_file, 'rb') as f:
             while True:
                 try:
-                    msg = eccodes.codes_grib_new_from_file(f)
+                    msg = new_from_file(f)
                 except Exception:
                     break  # Truncated trailing message — treat as EOF
                 if msg is None:
                     break
                 scanned += 1
                 try:
-                    ltype = eccodes.codes_get(msg, 'typeOfLevel')
+                    ltype = codes_get(msg, 'typeOfLevel')
                     if ltype != 'isobaricInhPa':
                         continue
 
-                    short_name = eccodes.codes_get(msg, 'shortName')
+                    short_name = codes_get(msg, 'shortName')
                     if short_name not in target_keys:
                         continue
 
-                    level = int(eccodes.codes_get(msg, 'level'))
-                    arr2d = self._grib_msg_to_2d(msg).astype(np.float32, copy=False)
+                    level = int(codes_get(msg, 'level'))
+                    arr2d = msg_to_2d(msg).astype(np.float32, copy=False)
                     fields_by_level[short_name][level] = arr2d
                     matched += 1
 
                     if lats is None or lons is None:
-                        lat_vals = np.asarray(eccodes.codes_get_array(msg, 'latitudes'), dtype=np.float32)
-                        lon_vals = np.asarray(eccodes.codes_get_array(msg, 'longitudes'), dtype=np.float32)
-                        lats = lat_vals.reshape(arr2d.shape)
-                        lons = lon_vals.reshape(arr2d.shape)
+                        # Every FHR of a run shares one grid: reuse its coordinates
+                        # (keyed by the GRIB grid definition) instead of decoding
+                        # the lat/lon arrays again for each file
+                        grid_id = codes_get(msg, 'md5GridSection')
+                        cached = self._gds_grids.get(grid_id)
+                        if cached is not None:
+                            lats, lons = cached
+                        else:
+                            lat_vals = np.asarray(eccodes.codes_get_array(msg, 'latitudes'), dtype=np.float32)
+                            lon_vals = np.asarray(eccodes.codes_get_array(msg, 'longitudes'), dtype=np.float32)
+                            lats = lat_vals.reshape(arr2d.shape)
+                            lons = lon_vals.reshape(arr2d.shape)
                 finally:
-                    eccodes.codes_release(msg)
+                    codes_release(msg)
 
         temp_by_level = fields_by_level.get('t', {})
         if not temp_by_level:
@@ -1035,8 +1138,10 @@ class InteractiveCrossSection:
         if lats is None or lons is None:
             raise RuntimeError("eccodes loader missing grid coordinates")
 
-        if np.isfinite(lons).any() and np.nanmax(lons) > 180:
-            lons = np.where(lons > 180, lons - 360, lons)
+        if grid_id not in self._gds_grids:
+            if np.any(lons > 180):
+                lons = np.where(lons > 180, lons - 360, lons)
+            lats, lons = self._gds_grids.setdefault(grid_id, self._share_grid(lats, lons))
 
         def stack_field(short_name: str) -> Optional[np.ndarray]:
             level_map = fields_by_level.get(short_name, {})
@@ -1097,7 +1202,7 @@ class InteractiveCrossSection:
                     eccodes.codes_release(msg)
 
         if surface_pressure is not None:
-            if np.isfinite(surface_pressure).any() and np.nanmax(surface_pressure) > 2000:
+            if np.any(surface_pressure > 2000):
                 surface_pressure = surface_pressure / 100.0
             fhr_data.surface_pressure = surface_pressure
         else:
@@ -1127,7 +1232,7 @@ class InteractiveCrossSection:
                 backend_kwargs={'indexpath': ''},
             )
 
-            var_name = list(ds_t.data_vars)[0]
+            var_name = next(iter(ds_t.data_vars))
             t_data = ds_t[var_name]
 
             if 'isobaricInhPa' in t_data.dims:
@@ -1167,7 +1272,7 @@ class InteractiveCrossSection:
                         backend_kwargs={'indexpath': ''},
                     )
                     if ds and len(ds.data_vars) > 0:
-                        var = list(ds.data_vars)[0]
+                        var = next(iter(ds.data_vars))
                         setattr(fhr_data, field_name, ds[var].values)
                     ds.close()
                 except Exception as e:
@@ -1184,7 +1289,7 @@ class InteractiveCrossSection:
                     backend_kwargs={'indexpath': ''},
                 )
                 if ds_sp and len(ds_sp.data_vars) > 0:
-                    sp_var = list(ds_sp.data_vars)[0]
+                    sp_var = next(iter(ds_sp.data_vars))
                     sp_data = ds_sp[sp_var].values
                     while sp_data.ndim > 2:
                         sp_data = sp_data[0]
@@ -1321,8 +1426,7 @@ class InteractiveCrossSection:
                     result = self._load_smoke_from_wrfnat(str(nat_file))
                     if result is not None:
                         fhr_data.smoke_hyb, fhr_data.smoke_pres_hyb = result
-                        print(f"  Loaded PM2.5 smoke on {fhr_data.smoke_hyb.shape[0]} hybrid levels "
-                              f"(max={np.nanmax(fhr_data.smoke_hyb):.1f} μg/m³)")
+                        print(f"  Loaded PM2.5 smoke on {fhr_data.smoke_hyb.shape[0]} hybrid levels")
             except Exception as e:
                 print(f"  Warning: Could not load smoke from wrfnat: {e}")
 
@@ -1345,6 +1449,7 @@ class InteractiveCrossSection:
 
             # Store
             fhr_data.grib_file = grib_file
+            fhr_data.lats, fhr_data.lons = self._share_grid(fhr_data.lats, fhr_data.lons)
             self.forecast_hours[forecast_hour] = fhr_data
 
             duration = time.perf_counter() - start
@@ -1409,12 +1514,18 @@ class InteractiveCrossSection:
                     break
 
         # Collect files to load
+        # One scandir of the run dir, then one listing per FHR dir present
+        import fnmatch
+        import os
+        fhr_dirs = {e.name for e in os.scandir(run_path) if e.is_dir()}
         files_to_load = []
         for fhr in range(max_hours + 1):
-            fhr_dir = run_path / f"F{fhr:02d}"
-            prs_files = list(fhr_dir.glob(prs_pattern))
+            name = f"F{fhr:02d}"
+            if name not in fhr_dirs:
+                continue
+            prs_files = sorted(fnmatch.filter(os.listdir(run_path / name), prs_pattern))
             if prs_files:
-                files_to_load.append((str(prs_files[0]), fhr))
+                files_to_load.append((str(run_path / name / prs_files[0]), fhr))
 
         if not files_to_load:
             print(f"No GRIB files found matching {prs_pattern}")
@@ -1449,6 +1560,7 @@ class InteractiveCrossSection:
                     try:
                         result = future.result()
                         if result is not None:
+                            result.lats, result.lons = self._share_grid(result.lats, result.lons)
                             self.forecast_hours[result.forecast_hour] = result
                     except Exception as e:
                         print(f"Error loading F{fhr:02d}: {e}")
@@ -1478,7 +1590,7 @@ class InteractiveCrossSection:
                     backend_kwargs={'indexpath': ''},
                 )
 
-                var_name = list(ds_t.data_vars)[0]
+                var_name = next(iter(ds_t.data_vars))
                 t_data = ds_t[var_name]
 
                 # Get pressure levels
@@ -1521,7 +1633,7 @@ class InteractiveCrossSection:
                             backend_kwargs={'indexpath': ''},
                         )
                         if ds and len(ds.data_vars) > 0:
-                            var = list(ds.data_vars)[0]
+                            var = next(iter(ds.data_vars))
                             setattr(fhr_data, field_name, ds[var].values)
                         ds.close()
                     except Exception:
@@ -1537,7 +1649,7 @@ class InteractiveCrossSection:
                         backend_kwargs={'indexpath': ''},
                     )
                     if ds_sp and len(ds_sp.data_vars) > 0:
-                        sp_var = list(ds_sp.data_vars)[0]
+                        sp_var = next(iter(ds_sp.data_vars))
                         sp_data = ds_sp[sp_var].values
                         while sp_data.ndim > 2:
                             sp_data = sp_data[0]
@@ -1590,14 +1702,19 @@ class InteractiveCrossSection:
 
         climo_path = self.climatology_dir / f"climo_{key}.npz"
         if not climo_path.exists():
-            # Fall back to nearest available FHR
-            candidates = sorted(self.climatology_dir.glob(
+            # Fall back to nearest available FHR. One min() pass, no sort;
+            # ties go to the earlier FHR, as the old sorted scan did.
+            candidates = list(self.climatology_dir.glob(
                 f"climo_{month:02d}_{init_hour:02d}z_F*.npz"
             ))
             if not candidates:
                 return None
-            best = min(candidates,
-                       key=lambda p: abs(int(p.stem.split('_F')[1]) - fhr))
+
+            def _fhr_distance(p):
+                cand_fhr = int(p.stem.split('_F')[1])
+                return abs(cand_fhr - fhr), cand_fhr
+
+            best = min(candidates, key=_fhr_distance)
             climo_path = best
             key = best.stem.replace('climo_', '')
             if key in self._climo_cache:
@@ -1636,16 +1753,35 @@ class InteractiveCrossSection:
 
         Returns dict of field_name -> (n_levels, n_points) arrays.
         """
-        from scipy.interpolate import RegularGridInterpolator
-
         n_points = len(path_lats)
-        pts = np.column_stack([path_lats, path_lons])
 
         climo_lats = climo.lats if climo.lats.ndim == 1 else climo.lats[:, 0]
         climo_lons = climo.lons if climo.lons.ndim == 1 else climo.lons[0, :]
 
-        # Ensure lats are ascending for RegularGridInterpolator
+        # Bilinear cells/weights are shared by every field and level, so they
+        # are computed once and each field is sampled as a whole level stack.
+        n_lat, n_lon = climo_lats.size, climo_lons.size
         lat_ascending = climo_lats[0] < climo_lats[-1]
+        lat_coords = climo_lats if lat_ascending else climo_lats[::-1]
+        axes_ok = (n_lat > 1 and n_lon > 1 and np.all(np.diff(lat_coords) > 0)
+                   and np.all(np.diff(climo_lons) > 0))
+        if axes_ok:
+            ii = np.clip(np.searchsorted(lat_coords, path_lats, 'right') - 1, 0, n_lat - 2)
+            jj = np.clip(np.searchsorted(climo_lons, path_lons, 'right') - 1, 0, n_lon - 2)
+            wy = (path_lats - lat_coords[ii]) / (lat_coords[ii + 1] - lat_coords[ii])
+            wx = (path_lons - climo_lons[jj]) / (climo_lons[jj + 1] - climo_lons[jj])
+            # float32 corner weights keep the per-field products in float32
+            # (the stored climatology is float16/float32)
+            w00 = ((1 - wy) * (1 - wx)).astype(np.float32)
+            w01 = ((1 - wy) * wx).astype(np.float32)
+            w10 = (wy * (1 - wx)).astype(np.float32)
+            w11 = (wy * wx).astype(np.float32)
+            r0, r1 = ii, ii + 1
+            if not lat_ascending:
+                r0, r1 = (n_lat - 1) - r0, (n_lat - 1) - r1
+            c0, c1 = jj, jj + 1
+            outside = ((path_lats < lat_coords[0]) | (path_lats > lat_coords[-1]) |
+                       (path_lons < climo_lons[0]) | (path_lons > climo_lons[-1]))
 
         result = {}
         for field_name in ('temperature', 'u_wind', 'v_wind', 'rh', 'omega',
@@ -1654,19 +1790,16 @@ class InteractiveCrossSection:
             if field_3d is None:
                 continue
             n_levels = field_3d.shape[0]
-            interp_result = np.full((n_levels, n_points), np.nan)
-            for lev in range(n_levels):
-                lev_data = field_3d[lev]
-                lat_coords = climo_lats
-                if not lat_ascending:
-                    lev_data = lev_data[::-1, :]
-                    lat_coords = climo_lats[::-1]
+            interp_result = np.full((n_levels, n_points), np.nan, dtype=np.float32)
+            if axes_ok:
                 try:
-                    interp = RegularGridInterpolator(
-                        (lat_coords, climo_lons), lev_data,
-                        method='linear', bounds_error=False, fill_value=np.nan
+                    interp_result[:] = (
+                        field_3d[:, r0, c0] * w00
+                        + field_3d[:, r0, c1] * w01
+                        + field_3d[:, r1, c0] * w10
+                        + field_3d[:, r1, c1] * w11
                     )
-                    interp_result[lev, :] = interp(pts)
+                    interp_result[:, outside] = np.nan
                 except Exception:
                     pass
             result[field_name] = interp_result
@@ -1691,9 +1824,9 @@ class InteractiveCrossSection:
 
         elif style == 'wind_speed':
             if 'u_wind' in data and 'v_wind' in data:
-                fcst_wspd = np.sqrt(data['u_wind']**2 + data['v_wind']**2) * 1.944
+                fcst_wspd = np.hypot(data['u_wind'], data['v_wind']) * 1.944
                 if 'u_wind' in climo_path and 'v_wind' in climo_path:
-                    climo_wspd = np.sqrt(climo_path['u_wind']**2 + climo_path['v_wind']**2) * 1.944
+                    climo_wspd = np.hypot(climo_path['u_wind'], climo_path['v_wind']) * 1.944
                     data['anomaly'] = fcst_wspd - climo_wspd
 
         elif style == 'rh':
@@ -1710,9 +1843,9 @@ class InteractiveCrossSection:
                 climo_q = climo_path['specific_humidity']
                 if pressure_levels is not None:
                     climo_theta = np.zeros_like(climo_T)
-                    for lev_idx, p in enumerate(pressure_levels):
-                        if lev_idx < climo_T.shape[0]:
-                            climo_theta[lev_idx] = climo_T[lev_idx] * (1000.0 / p) ** 0.286
+                    n = min(len(pressure_levels), climo_T.shape[0])
+                    scale = (1000.0 / np.asarray(pressure_levels[:n], dtype=np.float64)) ** 0.286
+                    climo_theta[:n] = climo_T[:n] * scale[:, None]
                     Lv, cp = 2.5e6, 1004.0
                     with np.errstate(invalid='ignore', divide='ignore'):
                         climo_theta_e = climo_theta * np.exp(Lv * climo_q / (cp * climo_T))
@@ -1732,13 +1865,10 @@ class InteractiveCrossSection:
                 u_c, v_c = climo_path['u_wind'], climo_path['v_wind']
                 n_levels = gh_c.shape[0]
                 climo_shear = np.full_like(gh_c, np.nan)
-                for lev in range(n_levels - 1):
-                    dz = gh_c[lev, :] - gh_c[lev + 1, :]
-                    dz = np.where(np.abs(dz) < 10, np.nan, dz)
-                    du = u_c[lev, :] - u_c[lev + 1, :]
-                    dv = v_c[lev, :] - v_c[lev + 1, :]
-                    dwind = np.sqrt(du**2 + dv**2)
-                    climo_shear[lev, :] = (dwind / np.abs(dz)) * 1000
+                dz = gh_c[:-1] - gh_c[1:]
+                dz = np.where(np.abs(dz) < 10, np.nan, dz)
+                dwind = np.hypot(u_c[:-1] - u_c[1:], v_c[:-1] - v_c[1:])
+                climo_shear[:-1] = (dwind / np.abs(dz)) * 1000
                 climo_shear[-1, :] = climo_shear[-2, :] if n_levels > 1 else 0
                 data['anomaly'] = data['shear'] - climo_shear
 
@@ -1748,11 +1878,9 @@ class InteractiveCrossSection:
                 gh_c = climo_path['geopotential_height']
                 n_levels = T_c.shape[0]
                 climo_lapse = np.full_like(T_c, np.nan)
-                for lev in range(n_levels - 1):
-                    dz = (gh_c[lev, :] - gh_c[lev + 1, :]) / 1000.0
-                    dz = np.where(np.abs(dz) < 0.01, np.nan, dz)
-                    dT = T_c[lev, :] - T_c[lev + 1, :]
-                    climo_lapse[lev, :] = -dT / dz
+                dz = (gh_c[:-1] - gh_c[1:]) / 1000.0
+                dz = np.where(np.abs(dz) < 0.01, np.nan, dz)
+                climo_lapse[:-1] = -(T_c[:-1] - T_c[1:]) / dz
                 climo_lapse[-1, :] = climo_lapse[-2, :] if n_levels > 1 else 0
                 data['anomaly'] = data['lapse_rate'] - climo_lapse
 
@@ -1760,20 +1888,13 @@ class InteractiveCrossSection:
             if 'wetbulb' in data and 'temperature' in climo_path and 'rh' in climo_path:
                 climo_tc = climo_path['temperature'] - 273.15
                 climo_rh = climo_path['rh']
-                climo_tw = (climo_tc * np.arctan(0.151977 * np.sqrt(climo_rh + 8.313659))
-                           + np.arctan(climo_tc + climo_rh)
-                           - np.arctan(climo_rh - 1.676331)
-                           + 0.00391838 * (climo_rh ** 1.5) * np.arctan(0.023101 * climo_rh)
-                           - 4.686035)
-                data['anomaly'] = data['wetbulb'] - climo_tw
+                data['anomaly'] = data['wetbulb'] - _stull_wetbulb(climo_tc, climo_rh)
 
         elif style == 'vpd':
             if 'vpd' in data and 'temperature' in climo_path and 'rh' in climo_path:
                 climo_tc = climo_path['temperature'] - 273.15
                 climo_rh = climo_path['rh']
-                climo_es = 6.1078 * np.exp(17.27 * climo_tc / (climo_tc + 237.3))
-                climo_vpd = climo_es * (1.0 - climo_rh / 100.0)
-                data['anomaly'] = data['vpd'] - climo_vpd
+                data['anomaly'] = data['vpd'] - _tetens_vpd(climo_tc, climo_rh)
 
         elif style == 'dewpoint_dep':
             if 'dewpoint_dep' in data and 'temperature' in climo_path and 'dew_point' in climo_path:
@@ -1787,7 +1908,7 @@ class InteractiveCrossSection:
                 climo_q = climo_path['specific_humidity']
                 climo_u = climo_path['u_wind']
                 climo_v = climo_path['v_wind']
-                climo_ws = np.sqrt(climo_u**2 + climo_v**2)
+                climo_ws = np.hypot(climo_u, climo_v)
                 climo_mt = climo_q * 1000.0 * climo_ws
                 data['anomaly'] = data['moisture_transport'] - climo_mt
 
@@ -1810,7 +1931,9 @@ class InteractiveCrossSection:
         temp_cmap: str = "standard",
         metadata: Dict = None,
         anomaly: bool = False,
-    ) -> Optional[bytes]:
+        image_format: str = "png",
+        terrain_out: Dict = None,
+    ) -> Optional[Union[bytes, "Image.Image"]]:
         """Generate cross-section from pre-loaded data.
 
         This is the fast path - should complete in <1 second.
@@ -1831,9 +1954,14 @@ class InteractiveCrossSection:
                          'distances_hires' keys to override terrain (for consistent GIF frames)
             temp_cmap: Temperature colormap choice ('green_purple', 'white_zero', 'nws_ndfd')
             anomaly: If True, subtract climatological mean and use diverging colormap
+            image_format: 'png' for encoded bytes, or 'image' for an RGB PIL Image
+                          (skips PNG encode for callers that re-encode)
+            terrain_out: Optional dict filled with this frame's terrain (same keys as
+                         terrain_data), so a batch can lock terrain to its first frame
+                         without a separate interpolation pass
 
         Returns:
-            PNG image bytes, or data dict if return_image=False
+            PNG image bytes (or PIL Image), or data dict if return_image=False
         """
         if forecast_hour not in self.forecast_hours:
             print(f"Forecast hour {forecast_hour} not loaded")
@@ -1844,14 +1972,8 @@ class InteractiveCrossSection:
         # Get pre-loaded data
         fhr_data = self.forecast_hours[forecast_hour]
 
-        # Adaptive n_points: ~1 point per 3km (HRRR native), clamped to [50, 1000]
         if n_points <= 0:
-            lat1, lon1 = np.radians(start_point[0]), np.radians(start_point[1])
-            lat2, lon2 = np.radians(end_point[0]), np.radians(end_point[1])
-            dlat, dlon = lat2 - lat1, lon2 - lon1
-            a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
-            dist_km = 6371 * 2 * np.arcsin(np.sqrt(a))
-            n_points = int(np.clip(dist_km / 3.0, 50, 1000))
+            n_points = self.adaptive_n_points(start_point, end_point)
 
         # Create path
         path_lats = np.linspace(start_point[0], end_point[0], n_points)
@@ -1865,6 +1987,11 @@ class InteractiveCrossSection:
         if not return_image:
             return data
 
+        if terrain_out is not None:
+            for key in ('surface_pressure', 'surface_pressure_hires', 'distances_hires'):
+                terrain_out[key] = data.get(key)
+            terrain_out['pressure_levels'] = fhr_data.pressure_levels
+
         # Override terrain for consistent GIF frames
         ref_pressure_levels = None
         if terrain_data is not None:
@@ -1907,7 +2034,7 @@ class InteractiveCrossSection:
                     }
 
         # Render
-        img_bytes = self._render_cross_section(data, style, dpi, metadata, y_axis, vscale, y_top, units=units, temp_cmap=temp_cmap, ref_pressure_levels=ref_pressure_levels, anomaly=anomaly, climo_info=climo_info)
+        img_bytes = self._render_cross_section(data, style, dpi, metadata, y_axis, vscale, y_top, units=units, temp_cmap=temp_cmap, ref_pressure_levels=ref_pressure_levels, anomaly=anomaly, climo_info=climo_info, image_format=image_format)
 
         t_total = time.perf_counter() - start
         print(f"Cross-section generated in {t_total:.3f}s (interp: {t_interp:.3f}s)")
@@ -1952,16 +2079,19 @@ class InteractiveCrossSection:
                 self._kdtree_grid_id = grid_id
             tgt_pts = np.column_stack([path_lats, path_lons])
             _, indices = tree.query(tgt_pts, k=1)
+            iy, ix = np.unravel_index(indices, lats_grid.shape)
 
+            # Nearest-neighbour gather straight from the (possibly float16/mmap)
+            # source — only the path points are read and upcast, no full-grid
+            # float32 copy per level.
             def interp_3d(field_3d):
-                result = np.full((n_levels, n_points), np.nan)
-                for lev in range(min(field_3d.shape[0], n_levels)):
-                    level_data = _ensure_float32(field_3d[lev])
-                    result[lev, :] = level_data.ravel()[indices]
+                result = np.full((n_levels, n_points), np.nan, dtype=np.float32)
+                n = min(field_3d.shape[0], n_levels)
+                result[:n, :] = field_3d[:n, iy, ix]
                 return result
 
             def interp_2d(field_2d):
-                return _ensure_float32(field_2d).ravel()[indices]
+                return np.asarray(field_2d[iy, ix], dtype=np.float32)
         else:
             # Regular grid - use bilinear interpolation
             lats_1d = lats_grid if lats_grid.ndim == 1 else lats_grid[:, 0]
@@ -1984,35 +2114,64 @@ class InteractiveCrossSection:
                 _lon_sort_idx = np.argsort(lons_1d)
                 lons_1d = lons_1d[_lon_sort_idx]
 
-            pts = np.column_stack([path_lats, path_lons])
+            # Bilinear interpolation only touches the cells around the path, so
+            # crop every level to that window (plus the bracketing row/column)
+            # before casting — a small block instead of the whole grid per level.
+            n_lat, n_lon = lats_1d.size, lons_1d.size
+            i0 = int(np.clip(np.searchsorted(lats_1d, path_lats.min(), 'right') - 1, 0, max(n_lat - 2, 0)))
+            i1 = int(np.clip(np.searchsorted(lats_1d, path_lats.max(), 'left') + 1, i0 + 2, n_lat))
+            j0 = int(np.clip(np.searchsorted(lons_1d, path_lons.min(), 'right') - 1, 0, max(n_lon - 2, 0)))
+            j1 = int(np.clip(np.searchsorted(lons_1d, path_lons.max(), 'left') + 1, j0 + 2, n_lon))
+
+            # Window rows/cols in the source array's own order
+            rows = np.arange(i0, i1)
+            if _lat_flip:
+                rows = (n_lat - 1) - rows
+            cols = np.arange(j0, j1) if _lon_sort_idx is None else _lon_sort_idx[j0:j1]
+            window = np.ix_(rows, cols)
+            lats_1d = lats_1d[i0:i1]
+            lons_1d = lons_1d[j0:j1]
 
             def _reorder_field(field):
-                """Flip/sort a 2D field to match the reordered lat/lon axes."""
-                f = field
-                if _lat_flip:
-                    f = f[::-1, :]
-                if _lon_sort_idx is not None:
-                    f = f[:, _lon_sort_idx]
-                return f
+                """Crop a 2D field to the path window, in ascending lat/lon order."""
+                return field[window]
+
+            # Bilinear weights depend only on the path, not the field or level:
+            # compute the bracketing cells and weights once, then every field is
+            # four corner gathers (all levels at once) and a weighted sum.
+            def _cell(axis_1d, coords):
+                k = np.clip(np.searchsorted(axis_1d, coords, 'right') - 1, 0, axis_1d.size - 2)
+                w = (coords - axis_1d[k]) / (axis_1d[k + 1] - axis_1d[k])
+                return k, w.astype(np.float32)
+
+            ii, wy = _cell(lats_1d, path_lats)
+            jj, wx = _cell(lons_1d, path_lons)
+            r0, r1 = rows[ii], rows[ii + 1]
+            c0, c1 = cols[jj], cols[jj + 1]
+            w00 = (1 - wy) * (1 - wx)
+            w01 = (1 - wy) * wx
+            w10 = wy * (1 - wx)
+            w11 = wy * wx
+            outside = ((path_lats < lats_1d[0]) | (path_lats > lats_1d[-1]) |
+                       (path_lons < lons_1d[0]) | (path_lons > lons_1d[-1]))
+
+            def _bilinear(field):
+                """Sample the last two (y, x) axes of field at the path points."""
+                out = field[..., r0, c0] * w00
+                out += field[..., r0, c1] * w01
+                out += field[..., r1, c0] * w10
+                out += field[..., r1, c1] * w11
+                out[..., outside] = np.nan
+                return out
 
             def interp_3d(field_3d):
-                result = np.full((n_levels, n_points), np.nan)
-                for lev in range(min(field_3d.shape[0], n_levels)):
-                    level_data = _reorder_field(_ensure_float32(field_3d[lev]))
-                    interp = RegularGridInterpolator(
-                        (lats_1d, lons_1d), level_data,
-                        method='linear', bounds_error=False, fill_value=np.nan
-                    )
-                    result[lev, :] = interp(pts)
+                result = np.full((n_levels, n_points), np.nan, dtype=np.float32)
+                n = min(field_3d.shape[0], n_levels)
+                result[:n, :] = _bilinear(field_3d[:n])
                 return result
 
             def interp_2d(field_2d):
-                level_data = _reorder_field(_ensure_float32(field_2d))
-                interp = RegularGridInterpolator(
-                    (lats_1d, lons_1d), level_data,
-                    method='linear', bounds_error=False, fill_value=np.nan
-                )
-                return interp(pts)
+                return _bilinear(field_2d).astype(np.float32, copy=False)
 
         # Build result dict
         result = {
@@ -2044,26 +2203,33 @@ class InteractiveCrossSection:
             total_dist_km = result['distances'][-1]
             # ~1.5km spacing gives smoother terrain while still following HRRR data
             terrain_res = max(100, int(total_dist_km / 1.5))
-            path_lats_hires = np.linspace(path_lats[0], path_lats[-1], terrain_res)
-            path_lons_hires = np.linspace(path_lons[0], path_lons[-1], terrain_res)
-
-            sp_f32 = _ensure_float32(fhr_data.surface_pressure)
-            if lats_grid.ndim == 2:
-                # Curvilinear - use same tree
-                tgt_pts_hires = np.column_stack([path_lats_hires, path_lons_hires])
-                _, indices_hires = tree.query(tgt_pts_hires, k=1)
-                sp_hires = sp_f32.ravel()[indices_hires]
+
+            if n_points >= terrain_res:
+                # Path is already at least as fine as the terrain target — reuse it
+                result['surface_pressure_hires'] = result['surface_pressure']
+                result['distances_hires'] = result['distances']
             else:
-                # Regular grid - bilinear interpolation
-                pts_hires = np.column_stack([path_lats_hires, path_lons_hires])
-                interp_sp = RegularGridInterpolator(
-                    (lats_1d, lons_1d), _reorder_field(sp_f32),
-                    method='linear', bounds_error=False, fill_value=np.nan
-                )
-                sp_hires = interp_sp(pts_hires)
+                path_lats_hires = np.linspace(path_lats[0], path_lats[-1], terrain_res)
+                path_lons_hires = np.linspace(path_lons[0], path_lons[-1], terrain_res)
+
+                if lats_grid.ndim == 2:
+                    # Curvilinear - use same tree
+                    tgt_pts_hires = np.column_stack([path_lats_hires, path_lons_hires])
+                    _, indices_hires = tree.query(tgt_pts_hires, k=1)
+                    iy_hires, ix_hires = np.unravel_index(indices_hires, lats_grid.shape)
+                    sp_hires = np.asarray(fhr_data.surface_pressure[iy_hires, ix_hires], dtype=np.float32)
+                else:
+                    # Regular grid - bilinear interpolation
+                    sp_f32 = _ensure_float32(_reorder_field(fhr_data.surface_pressure))
+                    pts_hires = np.column_stack([path_lats_hires, path_lons_hires])
+                    interp_sp = RegularGridInterpolator(
+                        (lats_1d, lons_1d), sp_f32,
+                        method='linear', bounds_error=False, fill_value=np.nan
+                    )
+                    sp_hires = interp_sp(pts_hires)
 
-            result['surface_pressure_hires'] = sp_hires
-            result['distances_hires'] = self._calculate_distances(path_lats_hires, path_lons_hires)
+                result['surface_pressure_hires'] = sp_hires
+                result['distances_hires'] = self._calculate_distances(path_lats_hires, path_lons_hires)
 
         # Style-specific fields
         if style in ['rh', 'q'] and fhr_data.rh is not None:
@@ -2104,10 +2270,8 @@ class InteractiveCrossSection:
             theta = result['theta']
             Lv = 2.5e6
             cp = 1004.0
-            theta_e = np.zeros_like(T)
-            for lev in range(len(fhr_data.pressure_levels)):
-                theta_e[lev, :] = theta[lev, :] * np.exp(Lv * q[lev, :] / (cp * T[lev, :]))
-            result['theta_e'] = theta_e
+            # Whole-section expression; Lv/cp folds to one constant
+            result['theta_e'] = theta * np.exp((Lv / cp) * q / T)
 
         if style == 'q' and fhr_data.specific_humidity is not None:
             result['specific_humidity'] = interp_3d(fhr_data.specific_humidity)
@@ -2122,25 +2286,21 @@ class InteractiveCrossSection:
                 u = result.get('u_wind')
                 v = result.get('v_wind')
                 if u is not None and v is not None:
-                    shear = np.full((n_levels, n_points), np.nan)
-                    for lev in range(n_levels - 1):
-                        dz = gh[lev, :] - gh[lev + 1, :]
-                        dz = np.where(np.abs(dz) < 10, np.nan, dz)
-                        du = u[lev, :] - u[lev + 1, :]
-                        dv = v[lev, :] - v[lev + 1, :]
-                        dwind = np.sqrt(du**2 + dv**2)
-                        shear[lev, :] = (dwind / np.abs(dz)) * 1000
+                    # Layer differences between adjacent levels, all columns at once
+                    shear = np.full((n_levels, n_points), np.nan, dtype=np.float32)
+                    dz = gh[:-1] - gh[1:]
+                    dz = np.where(np.abs(dz) < 10, np.nan, dz)
+                    dwind = np.hypot(u[:-1] - u[1:], v[:-1] - v[1:])
+                    shear[:-1] = (dwind / np.abs(dz)) * 1000
                     shear[-1, :] = shear[-2, :]
                     result['shear'] = shear
 
             if style == 'lapse_rate':
                 T = result['temperature']
-                lapse = np.full((n_levels, n_points), np.nan)
-                for lev in range(n_levels - 1):
-                    dz = (gh[lev, :] - gh[lev + 1, :]) / 1000.0
-                    dz = np.where(np.abs(dz) < 0.01, np.nan, dz)
-                    dT = T[lev, :] - T[lev + 1, :]
-                    lapse[lev, :] = -dT / dz
+                lapse = np.full((n_levels, n_points), np.nan, dtype=np.float32)
+                dz = (gh[:-1] - gh[1:]) / 1000.0
+                dz = np.where(np.abs(dz) < 0.01, np.nan, dz)
+                lapse[:-1] = -(T[:-1] - T[1:]) / dz
                 lapse[-1, :] = lapse[-2, :]
                 result['lapse_rate'] = lapse
 
@@ -2148,12 +2308,7 @@ class InteractiveCrossSection:
             T_c = result['temp_c']
             RH = interp_3d(fhr_data.rh)
             result['rh'] = RH
-            Tw = (T_c * np.arctan(0.151977 * np.sqrt(RH + 8.313659))
-                  + np.arctan(T_c + RH)
-                  - np.arctan(RH - 1.676331)
-                  + 0.00391838 * (RH ** 1.5) * np.arctan(0.023101 * RH)
-                  - 4.686035)
-            result['wetbulb'] = Tw
+            result['wetbulb'] = _stull_wetbulb(T_c, RH)
 
         if style == 'icing' and fhr_data.cloud is not None:
             T_c = result['temp_c']
@@ -2165,9 +2320,7 @@ class InteractiveCrossSection:
             RH = interp_3d(fhr_data.rh)
             result['rh'] = RH
             T_c = result['temp_c']
-            # Tetens formula for saturation vapor pressure (hPa)
-            es = 6.1078 * np.exp(17.27 * T_c / (T_c + 237.3))
-            result['vpd'] = es * (1.0 - RH / 100.0)
+            result['vpd'] = _tetens_vpd(T_c, RH)
 
         if style == 'dewpoint_dep' and fhr_data.dew_point is not None:
             td = interp_3d(fhr_data.dew_point)
@@ -2180,7 +2333,7 @@ class InteractiveCrossSection:
             u = result.get('u_wind')
             v = result.get('v_wind')
             if u is not None and v is not None:
-                wind_speed = np.sqrt(u**2 + v**2)
+                wind_speed = np.hypot(u, v)
                 result['moisture_transport'] = q * 1000.0 * wind_speed  # g/kg * m/s
 
         if style == 'pv' and fhr_data.vorticity is not None:
@@ -2189,16 +2342,21 @@ class InteractiveCrossSection:
             theta = result['theta']
             p_levels = fhr_data.pressure_levels  # hPa
             n_lev = len(p_levels)
-            # Centered finite difference for dθ/dp
-            dtheta_dp = np.zeros_like(theta)
-            for lev in range(1, n_lev - 1):
-                dp = (p_levels[lev + 1] - p_levels[lev - 1]) * 100.0  # hPa → Pa
-                dtheta_dp[lev, :] = (theta[lev + 1, :] - theta[lev - 1, :]) / dp
-            dtheta_dp[0, :] = dtheta_dp[1, :]
-            dtheta_dp[-1, :] = dtheta_dp[-2, :]
+            # Centered finite difference for dθ/dp, all levels at once.
+            # Fold -g, hPa → Pa and the PVU scale into the per-level reciprocal
+            # so the grid sees one multiply instead of a divide per level.
             g = 9.81
-            pv = -g * vort * dtheta_dp  # K m² kg⁻¹ s⁻¹
-            result['pv'] = pv * 1e6  # Convert to PVU
+            p_arr = np.asarray(p_levels, dtype=np.float64)
+            inv_dp = (-g * 1e6 / 100.0) / (p_arr[2:] - p_arr[:-2])
+            pv = np.zeros_like(theta)
+            if n_lev > 2:
+                np.multiply(theta[2:] - theta[:-2],
+                            inv_dp.astype(theta.dtype)[:, None],
+                            out=pv[1:-1])
+                pv[0, :] = pv[1, :]
+                pv[-1, :] = pv[-2, :]
+            pv *= vort
+            result['pv'] = pv  # PVU (K m² kg⁻¹ s⁻¹ × 1e6)
 
         if style == 'fire_wx' and fhr_data.rh is not None:
             RH = interp_3d(fhr_data.rh)
@@ -2209,14 +2367,7 @@ class InteractiveCrossSection:
         if style in ('temp', 'rh', 'theta_e', 'omega', 'moisture_transport', 'fire_wx') and fhr_data.rh is not None:
             if 'rh' not in result:
                 result['rh'] = interp_3d(fhr_data.rh)
-            RH_wb = result['rh']
-            T_c_wb = result['temp_c']
-            Tw_overlay = (T_c_wb * np.arctan(0.151977 * np.sqrt(RH_wb + 8.313659))
-                          + np.arctan(T_c_wb + RH_wb)
-                          - np.arctan(RH_wb - 1.676331)
-                          + 0.00391838 * (RH_wb ** 1.5) * np.arctan(0.023101 * RH_wb)
-                          - 4.686035)
-            result['wetbulb_overlay'] = Tw_overlay
+            result['wetbulb_overlay'] = _stull_wetbulb(result['temp_c'], result['rh'])
 
         if style == 'frontogenesis':
             # Petterssen Kinematic Frontogenesis (Winter Bander Mode)
@@ -2253,43 +2404,58 @@ class InteractiveCrossSection:
 
                 # Magnitude of theta gradient
                 grad_theta_mag = np.abs(dtheta_ds)
-                grad_theta_mag = np.where(grad_theta_mag < 1e-10, 1e-10, grad_theta_mag)  # Avoid div by zero
+                np.maximum(grad_theta_mag, 1e-10, out=grad_theta_mag)  # Avoid div by zero
 
                 # Frontogenesis: F = -|∇θ| * d(u_n)/ds where u_n is normal to theta gradient
                 # For section: F ≈ -(dθ/ds)^2 / |dθ/ds| * du_section/ds
                 # Simplified: F = -sign(dθ/ds) * |dθ/ds| * du_section/ds
-                frontogenesis_raw = -dtheta_ds * du_section_ds / grad_theta_mag
+                # (built in one buffer with in-place ops — no per-step temporaries)
+                frontogenesis = np.multiply(dtheta_ds, du_section_ds)
+                frontogenesis /= grad_theta_mag
 
                 # Convert units: K/m * m/s / m = K/m/s
                 # Scale to K/100km/3hr: multiply by 100000 (100km) * 10800 (3hr)
                 # = 1.08e9, but values are very small, so use 1e11 scaling
-                frontogenesis = frontogenesis_raw * 1.08e9
+                # (sign flip folded into the same multiply)
+                frontogenesis *= -1.08e9
 
                 # Light smoothing on output for cleaner visualization
                 frontogenesis = gaussian_filter(frontogenesis, sigma=0.8)
 
                 # Mask unrealistic values (cap at ±5 K/100km/3hr)
-                frontogenesis = np.clip(frontogenesis, -5, 5)
+                np.clip(frontogenesis, -5, 5, out=frontogenesis)
 
                 result['frontogenesis'] = frontogenesis
 
         return result
 
+    @staticmethod
+    def adaptive_n_points(start_point: Tuple[float, float], end_point: Tuple[float, float]) -> int:
+        """Path resolution: ~1 point per 3km (HRRR native), clamped to [50, 1000].
+
+        Endpoints are plain floats, so the haversine runs through math rather
+        than numpy ufuncs, whose 0-d dispatch costs more than the arithmetic.
+        """
+        lat1, lat2 = math.radians(start_point[0]), math.radians(end_point[0])
+        dlat = lat2 - lat1
+        dlon = math.radians(end_point[1] - start_point[1])
+        a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+        dist_km = 6371 * 2 * math.asin(math.sqrt(a))
+        return int(min(max(dist_km / 3.0, 50), 1000))
+
     def _calculate_distances(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
         """Calculate cumulative distance along path in km."""
         R = 6371
-        distances = [0]
-        for i in range(1, len(lats)):
-            lat1, lon1 = np.radians(lats[i-1]), np.radians(lons[i-1])
-            lat2, lon2 = np.radians(lats[i]), np.radians(lons[i])
-            dlat = lat2 - lat1
-            dlon = lon2 - lon1
-            a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
-            c = 2 * np.arcsin(np.sqrt(a))
-            distances.append(distances[-1] + R * c)
-        return np.array(distances)
+        lat = np.radians(lats)
+        lon = np.radians(lons)
+        a = (np.sin(np.diff(lat) / 2) ** 2
+             + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(np.diff(lon) / 2) ** 2)
+        distances = np.zeros(len(lat))
+        np.cumsum(2 * R * np.arcsin(np.sqrt(a)), out=distances[1:])
+        return distances
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _build_temp_colormap(name: str = "standard"):
         """Build a temperature colormap by name.
 
@@ -2403,8 +2569,9 @@ class InteractiveCrossSection:
                                y_axis: str = "pressure", vscale: float = 1.0, y_top: int = 100,
                                units: str = "km", temp_cmap: str = "standard",
                                ref_pressure_levels: np.ndarray = None,
-                               anomaly: bool = False, climo_info: Dict = None) -> bytes:
-        """Render cross-section to PNG bytes.
+                               anomaly: bool = False, climo_info: Dict = None,
+                               image_format: str = "png") -> Union[bytes, "Image.Image"]:
+        """Render cross-section to PNG bytes (or an RGB PIL Image if image_format='image').
 
         Args:
             data: Interpolated cross-section data
@@ -2419,7 +2586,6 @@ class InteractiveCrossSection:
         import matplotlib
         matplotlib.use('Agg')
         import matplotlib.colors as mcolors
-        from matplotlib.figure import Figure
         from matplotlib.ticker import MultipleLocator
         from datetime import datetime, timedelta
 
@@ -2462,9 +2628,9 @@ class InteractiveCrossSection:
 
         n_levels, n_points = theta.shape if theta is not None else (len(pressure_levels), len(distances))
 
-        # Compute wind speed
-        if u_wind is not None and v_wind is not None:
-            wind_speed = np.sqrt(u_wind**2 + v_wind**2) * 1.944
+        # Compute wind speed (only the wind_speed and fire_wx styles draw it)
+        if u_wind is not None and v_wind is not None and style in ('wind_speed', 'fire_wx'):
+            wind_speed = np.hypot(u_wind, v_wind) * 1.944
         else:
             wind_speed = None
 
@@ -2472,14 +2638,12 @@ class InteractiveCrossSection:
         # contourf is left unmasked — terrain fill (zorder=5) covers it visually
         terrain_mask = None
         if surface_pressure is not None:
-            terrain_mask = np.zeros((len(pressure_levels), n_points), dtype=bool)
-            for i in range(n_points):
-                terrain_mask[:, i] = pressure_levels > surface_pressure[i]
+            terrain_mask = pressure_levels[:, np.newaxis] > surface_pressure[np.newaxis, :]
 
         # Create figure - 25% larger with room for inset above and labels below
         base_height = 11.0
         fig_height = base_height * min(max(vscale, 0.5), 3.0)
-        fig = Figure(figsize=(17, fig_height), facecolor='white')
+        fig = self._pooled_figure(17, fig_height)
         ax = fig.add_subplot(111)
         ax.set_position([0.06, 0.12, 0.82, 0.68])  # Room above for inset, below for labels
 
@@ -2559,7 +2723,10 @@ class InteractiveCrossSection:
             # Symmetric auto-scaling from 98th percentile of |anomaly|
             finite_vals = anomaly_field[np.isfinite(anomaly_field)]
             if len(finite_vals) > 0:
-                vmax = np.percentile(np.abs(finite_vals), 98)
+                # finite_vals is already a private copy: take |x| in place and
+                # let percentile partition it rather than copying it twice more
+                np.abs(finite_vals, out=finite_vals)
+                vmax = np.percentile(finite_vals, 98, overwrite_input=True)
                 vmax = max(vmax, 0.1)  # Floor to avoid degenerate range
             else:
                 vmax = 1.0
@@ -2628,7 +2795,8 @@ class InteractiveCrossSection:
             omega = data.get('omega')
             if omega is not None:
                 omega_display = omega * 36.0
-                omega_max = min(np.nanmax(np.abs(omega_display)), 20)
+                # |x| max without materialising np.abs(x)
+                omega_max = min(max(np.nanmax(omega_display), -np.nanmin(omega_display)), 20)
                 cf = ax.contourf(X, Y, omega_display, levels=np.linspace(-omega_max, omega_max, 21),
                                 cmap='RdBu_r', extend='both')
                 cbar_ax = fig.add_axes([0.90, 0.12, 0.012, 0.68])
@@ -2745,7 +2913,7 @@ class InteractiveCrossSection:
             vort = data.get('vorticity')
             if vort is not None:
                 vort_scaled = vort * 1e5  # Scale for display
-                vort_max = min(np.nanmax(np.abs(vort_scaled)), 30)
+                vort_max = min(max(np.nanmax(vort_scaled), -np.nanmin(vort_scaled)), 30)
                 cf = ax.contourf(X, Y, vort_scaled, levels=np.linspace(-vort_max, vort_max, 21),
                                 cmap='RdBu_r', extend='both')
                 cbar_ax = fig.add_axes([0.90, 0.12, 0.012, 0.68])
@@ -2756,8 +2924,8 @@ class InteractiveCrossSection:
             smoke_hyb = data.get('smoke_hyb')  # (n_hyb, n_points)
             smoke_pres = data.get('smoke_pres_hyb')  # (n_hyb, n_points) — pressure in hPa
             if smoke_hyb is not None and smoke_pres is not None:
-                from config.colormaps import create_all_colormaps
-                smoke_cmap = create_all_colormaps()['NOAASmoke']
+                from config.colormaps import get_colormap
+                smoke_cmap = get_colormap('NOAASmoke')
 
                 # Build smoke's own X/Y mesh on native hybrid levels
                 # Y = per-column pressure (varies with terrain), X = distance along path
@@ -2902,10 +3070,10 @@ class InteractiveCrossSection:
                 cbar_ax = fig.add_axes([0.90, 0.12, 0.012, 0.68])
                 cbar = fig.colorbar(cf, cax=cbar_ax)
                 cbar.set_label('Relative Humidity (%)')
-                # Red Flag thresholds
+                # Red Flag thresholds (one contour pass for both levels)
                 try:
-                    ax.contour(X, Y, rh, levels=[15], colors='red', linewidths=2.5, linestyles='--')
-                    ax.contour(X, Y, rh, levels=[25], colors='orange', linewidths=2, linestyles='--')
+                    ax.contour(X, Y, rh, levels=[15, 25], colors=['red', 'orange'],
+                               linewidths=[2.5, 2], linestyles='--')
                 except:
                     pass
                 # Wind speed threshold (25 kt)
@@ -2915,10 +3083,10 @@ class InteractiveCrossSection:
                     except:
                         pass
                     # Cross-hatch critical zone (RH<15% AND wind>25kt)
-                    critical = ((rh < 15) & (wind_speed > 25)).astype(float)
-                    if np.any(critical > 0):
+                    critical = (rh < 15) & (wind_speed > 25)
+                    if critical.any():
                         try:
-                            ax.contourf(X, Y, critical, levels=[0.5, 1.5],
+                            ax.contourf(X, Y, critical.astype(float), levels=[0.5, 1.5],
                                        colors='none', hatches=['xxx'], alpha=0)
                         except:
                             pass
@@ -2973,24 +3141,24 @@ class InteractiveCrossSection:
 
             X_barb = distances[x_idx]
             Y_barb = y_coord[y_idx]  # Use appropriate Y coordinate (height or pressure)
-            XX_barb, YY_barb = np.meshgrid(X_barb, Y_barb)
-
-            # Get wind at subsampled points
-            U_barb = u_wind[np.ix_(y_idx, x_idx)].copy()
-            V_barb = v_wind[np.ix_(y_idx, x_idx)].copy()
-
-            # Mask below terrain
-            if surface_pressure is not None:
-                for i, xi in enumerate(x_idx):
-                    sp = surface_pressure[xi]
-                    for j, yj in enumerate(y_idx):
-                        if pressure_levels_filtered[yj] > sp:
-                            U_barb[j, i] = np.nan
-                            V_barb[j, i] = np.nan
-
-            # Convert m/s to knots
-            U_kt = U_barb * 1.944
-            V_kt = V_barb * 1.944
+            # Broadcast views rather than materialised meshgrid copies
+            barb_shape = (len(y_idx), len(x_idx))
+            XX_barb = np.broadcast_to(X_barb[np.newaxis, :], barb_shape)
+            YY_barb = np.broadcast_to(Y_barb[:, np.newaxis], barb_shape)
+
+            # Get wind at subsampled points, converted m/s -> knots
+            # (fancy indexing already returns a copy, so scale it in place)
+            U_kt = u_wind[np.ix_(y_idx, x_idx)]
+            V_kt = v_wind[np.ix_(y_idx, x_idx)]
+            U_kt *= 1.944
+            V_kt *= 1.944
+
+            # Mask below terrain: the barb grid is a subsample of the
+            # already-filtered terrain mask, so index it instead of re-comparing
+            if terrain_mask is not None:
+                below = terrain_mask[np.ix_(y_idx, x_idx)]
+                U_kt[below] = np.nan
+                V_kt[below] = np.nan
 
             # Show wind direction relative to cross-section orientation
             # Barbs point in direction wind is FROM
@@ -2998,9 +3166,13 @@ class InteractiveCrossSection:
             U_rot = U_kt
             V_rot = V_kt
 
+            # Only hand drawable barbs to matplotlib — each one becomes a polygon
+            # in the Barbs collection, so skip the underground/NaN points up front
+            valid = np.isfinite(U_rot) & np.isfinite(V_rot)
+
             # Plot wind barbs
             ax.barbs(
-                XX_barb, YY_barb, U_rot, V_rot,
+                XX_barb[valid], YY_barb[valid], U_rot[valid], V_rot[valid],
                 length=5, barbcolor='black', flagcolor='black',
                 linewidth=0.6, pivot='middle',
                 sizes=dict(emptybarb=0.04, spacing=0.12, height=0.35),
@@ -3146,8 +3318,8 @@ class InteractiveCrossSection:
             from cartopy.feature import ShapelyFeature
 
             # Calculate extent with padding
-            lon_min, lon_max = min(lons) - 2, max(lons) + 2
-            lat_min, lat_max = min(lats) - 1.5, max(lats) + 1.5
+            lon_min, lon_max = float(lons.min()) - 2, float(lons.max()) + 2
+            lat_min, lat_max = float(lats.min()) - 1.5, float(lats.max()) + 1.5
 
             # Ensure minimum extent so map doesn't get too skinny
             lon_range = lon_max - lon_min
@@ -3208,15 +3380,54 @@ class InteractiveCrossSection:
                  ha='center', va='bottom', fontsize=7, color='#888888',
                  transform=fig.transFigure, style='italic', fontweight='bold')
 
-        # Save to bytes (don't use tight_layout or bbox_inches - conflicts with inset positioning)
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png', dpi=dpi, facecolor='white')
-        buf.seek(0)
-        result = buf.read()
-        fig.clear()
-        del fig
+        # Draw once straight into the Agg buffer (don't use tight_layout or
+        # bbox_inches - conflicts with inset positioning). This skips savefig's
+        # per-call canvas switch and re-draw; PNG is encoded from the buffer.
+        fig.set_dpi(dpi)
+        canvas = fig.canvas
+        canvas.draw()
+        from PIL import Image
+        # Wrap the pooled canvas's buffer without copying and convert straight
+        # to RGB: the only per-frame allocation is the 3 B/px result. Figure
+        # background is opaque white, so dropping alpha is lossless.
+        img = Image.frombuffer('RGBA', canvas.get_width_height(), canvas.buffer_rgba(),
+                               'raw', 'RGBA', 0, 1).convert('RGB')
+        if image_format == 'image':
+            # GIF assembly palettizes the image itself; skip PNG entirely
+            result = img
+        else:
+            buf = io.BytesIO()
+            img.save(buf, format='PNG', compress_level=self.PNG_COMPRESS_LEVEL)
+            result = buf.getvalue()
+        self._release_figure(fig)
         return result
 
+    def _pooled_figure(self, width: float, height: float):
+        """Take an idle Figure (with Agg canvas) from the pool, resized.
+
+        The dashboard serves each request on a fresh thread and runs one
+        instance per model, so figures come from the module-level pool rather
+        than per thread or per instance. A render that raises never returns
+        its figure; it is simply dropped.
+        """
+        with _fig_pool_lock:
+            fig = _fig_pool.pop() if _fig_pool else None
+        if fig is None:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            fig = Figure(figsize=(width, height), facecolor='white')
+            FigureCanvasAgg(fig)
+        else:
+            fig.set_size_inches(width, height)
+        return fig
+
+    def _release_figure(self, fig) -> None:
+        """Clear a rendered Figure and return it to the pool if there is room."""
+        fig.clear()
+        with _fig_pool_lock:
+            if len(_fig_pool) < FIG_POOL_SIZE:
+                _fig_pool.append(fig)
+
     def get_loaded_hours(self) -> List[int]:
         """Get list of loaded forecast hours."""
         return sorted(self.forecast_hours.keys())
@@ -93,6 +93,11 @@ def extract_cross_section_multi_fields(
             'distances': _calculate_distances(path_lats, path_lons),
         }
 
+        # Target points and their nearest grid indices are the same for every
+        # field, so the KD-tree is built and queried at most once per call
+        path_pts = np.column_stack([path_lats, path_lons])
+        path_indices = None
+
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
 
@@ -112,7 +117,7 @@ def extract_cross_section_multi_fields(
                         print(f"Could not load {grib_key}")
                         continue
 
-                    var_name = list(ds.data_vars)[0]
+                    var_name = next(iter(ds.data_vars))
                     data = ds[var_name]
 
                     # Get pressure levels (only once)
@@ -146,19 +151,19 @@ def extract_cross_section_multi_fields(
                     lats_grid = result['lats_grid']
                     lons_grid = result['lons_grid']
 
-                    # Handle case where field has different number of levels
+                    # Handle case where field has different number of levels.
+                    # float32 matches the GRIB source precision and halves the
+                    # footprint of every derived field (theta, theta_e, ...)
                     actual_levels = data_values.shape[0]
-                    data_3d = np.full((n_levels, n_points), np.nan)
+                    data_3d = np.full((n_levels, n_points), np.nan, dtype=np.float32)
 
                     if lats_grid.ndim == 2:  # Curvilinear
-                        src_pts = np.column_stack([lats_grid.ravel(), lons_grid.ravel()])
-                        tree = cKDTree(src_pts)
-                        tgt_pts = np.column_stack([path_lats, path_lons])
-                        _, indices = tree.query(tgt_pts, k=1)
+                        if path_indices is None:
+                            src_pts = np.column_stack([lats_grid.ravel(), lons_grid.ravel()])
+                            _, path_indices = cKDTree(src_pts).query(path_pts, k=1)
 
-                        for lev_idx in range(min(actual_levels, n_levels)):
-                            level_data = data_values[lev_idx].ravel()
-                            data_3d[lev_idx, :] = level_data[indices]
+                        n_copy = min(actual_levels, n_levels)
+                        data_3d[:n_copy, :] = data_values[:n_copy].reshape(n_copy, -1)[:, path_indices]
                     else:
                         from scipy.interpolate import RegularGridInterpolator
                         lats_1d = lats_grid if lats_grid.ndim == 1 else lats_grid[:, 0]
@@ -169,7 +174,7 @@ def extract_cross_section_multi_fields(
                                 (lats_1d, lons_1d), data_values[lev_idx],
                                 method='linear', bounds_error=False, fill_value=np.nan
                             )
-                            data_3d[lev_idx, :] = interp(np.column_stack([path_lats, path_lons]))
+                            data_3d[lev_idx, :] = interp(path_pts)
 
                     result[field_name] = data_3d
                     ds.close()
@@ -199,7 +204,7 @@ def extract_cross_section_multi_fields(
                         backend_kwargs={'indexpath': ''},
                     )
                     if ds_sp and len(ds_sp.data_vars) > 0:
-                        sp_var = list(ds_sp.data_vars)[0]
+                        sp_var = next(iter(ds_sp.data_vars))
                         sp_data = ds_sp[sp_var].values
                         while sp_data.ndim > 2:
                             sp_data = sp_data[0]
@@ -208,11 +213,10 @@ def extract_cross_section_multi_fields(
                         lons_grid = result['lons_grid']
 
                         if lats_grid.ndim == 2:
-                            src_pts = np.column_stack([lats_grid.ravel(), lons_grid.ravel()])
-                            tree = cKDTree(src_pts)
-                            tgt_pts = np.column_stack([path_lats, path_lons])
-                            _, indices = tree.query(tgt_pts, k=1)
-                            sp_path = sp_data.ravel()[indices]
+                            if path_indices is None:
+                                src_pts = np.column_stack([lats_grid.ravel(), lons_grid.ravel()])
+                                _, path_indices = cKDTree(src_pts).query(path_pts, k=1)
+                            sp_path = sp_data.ravel()[path_indices]
                         else:
                             from scipy.interpolate import RegularGridInterpolator
                             lats_1d = lats_grid if lats_grid.ndim == 1 else lats_grid[:, 0]
@@ -221,7 +225,7 @@ def extract_cross_section_multi_fields(
                                 (lats_1d, lons_1d), sp_data,
                                 method='linear', bounds_error=False, fill_value=np.nan
                             )
-                            sp_path = interp(np.column_stack([path_lats, path_lons]))
+                            sp_path = interp(path_pts)
 
                         # Convert Pa to hPa
                         if sp_path.max() > 2000:
@@ -278,7 +282,7 @@ def extract_cross_section_multi_fields(
 
         # Compute total cloud condensate
         if style == "cloud_total":
-            total = np.zeros_like(result.get('cloud', np.zeros((len(result['pressure_levels']), n_points))))
+            total = np.zeros_like(result.get('cloud', np.zeros((len(result['pressure_levels']), n_points), dtype=np.float32)))
             for field in ['cloud', 'rain', 'snow', 'graupel']:
                 if field in result:
                     total = total + result[field]
@@ -294,7 +298,7 @@ def extract_cross_section_multi_fields(
 
             # Shear is computed between adjacent levels
             n_lev = len(P)
-            shear = np.full((n_lev, n_points), np.nan)
+            shear = np.full((n_lev, n_points), np.nan, dtype=np.float32)
 
             for lev_idx in range(n_lev - 1):
                 # Height difference in meters
@@ -304,7 +308,7 @@ def extract_cross_section_multi_fields(
                 # Wind difference
                 du = u[lev_idx, :] - u[lev_idx + 1, :]
                 dv = v[lev_idx, :] - v[lev_idx + 1, :]
-                dwind = np.sqrt(du**2 + dv**2)
+                dwind = np.hypot(du, dv)
 
                 # Shear in 1/s, multiply by 1000 for display (10^-3 /s)
                 shear[lev_idx, :] = (dwind / np.abs(dz)) * 1000
@@ -346,7 +350,7 @@ def extract_cross_section_multi_fields(
             P = result['pressure_levels']
 
             n_lev = len(P)
-            lapse = np.full((n_lev, n_points), np.nan)
+            lapse = np.full((n_lev, n_points), np.nan, dtype=np.float32)
 
             for lev_idx in range(n_lev - 1):
                 # Height difference in km
@@ -441,25 +445,24 @@ def create_production_cross_section(
 
         # Compute wind speed if we have u/v
         if u_wind is not None and v_wind is not None:
-            wind_speed = np.sqrt(u_wind**2 + v_wind**2) * 1.944  # m/s to knots
+            wind_speed = np.hypot(u_wind, v_wind) * 1.944  # m/s to knots
         else:
             wind_speed = None
 
-        # Apply terrain masking
+        # Apply terrain masking: one (n_levels, n_points) mask of below-ground
+        # cells, shared by every field drawn below
+        terrain_mask = None
         if surface_pressure is not None:
-            for i in range(n_points):
-                sp = surface_pressure[i]
-                for lev_idx, plev in enumerate(pressure_levels):
-                    if plev > sp:
-                        theta[lev_idx, i] = np.nan
-                        if wind_speed is not None:
-                            wind_speed[lev_idx, i] = np.nan
-                        if u_wind is not None:
-                            u_wind[lev_idx, i] = np.nan
-                        if v_wind is not None:
-                            v_wind[lev_idx, i] = np.nan
-                        if temperature is not None:
-                            temperature[lev_idx, i] = np.nan
+            terrain_mask = np.asarray(pressure_levels)[:, None] > np.asarray(surface_pressure)[None, :]
+            theta[terrain_mask] = np.nan
+            if wind_speed is not None:
+                wind_speed[terrain_mask] = np.nan
+            if u_wind is not None:
+                u_wind[terrain_mask] = np.nan
+            if v_wind is not None:
+                v_wind[terrain_mask] = np.nan
+            if temperature is not None:
+                temperature[terrain_mask] = np.nan
 
         # Create figure with extra space at top for inset map
         fig, ax = plt.subplots(figsize=(14, 8.5), facecolor='white')
@@ -490,13 +493,9 @@ def create_production_cross_section(
             omega = data.get('omega')
             if omega is not None:
                 # Apply terrain mask to omega
-                if surface_pressure is not None:
+                if terrain_mask is not None:
                     omega = omega.copy()
-                    for i in range(n_points):
-                        sp = surface_pressure[i]
-                        for lev_idx, plev in enumerate(pressure_levels):
-                            if plev > sp:
-                                omega[lev_idx, i] = np.nan
+                    omega[terrain_mask] = np.nan
 
                 # Convert Pa/s to hPa/hr for better visualization
                 omega_display = omega * 36.0  # Pa/s to hPa/hr
@@ -516,13 +515,9 @@ def create_production_cross_section(
             vort = data.get('vorticity')
             if vort is not None:
                 # Apply terrain mask
-                if surface_pressure is not None:
+                if terrain_mask is not None:
                     vort = vort.copy()
-                    for i in range(n_points):
-                        sp = surface_pressure[i]
-                        for lev_idx, plev in enumerate(pressure_levels):
-                            if plev > sp:
-                                vort[lev_idx, i] = np.nan
+                    vort[terrain_mask] = np.nan
 
                 # Scale to 10^-5 /s for display
                 vort_display = vort * 1e5
@@ -542,13 +537,9 @@ def create_production_cross_section(
             cloud = data.get('cloud')
             if cloud is not None:
                 # Apply terrain mask
-                if surface_pressure is not None:
+                if terrain_mask is not None:
                     cloud = cloud.copy()
-                    for i in range(n_points):
-                        sp = surface_pressure[i]
-                        for lev_idx, plev in enumerate(pressure_levels):
-                            if plev > sp:
-                                cloud[lev_idx, i] = np.nan
+                    cloud[terrain_mask] = np.nan
 
                 # Convert kg/kg to g/kg
                 cloud_display = cloud * 1000
@@ -569,13 +560,9 @@ def create_production_cross_section(
             temp_c = data.get('temp_c')
             if temp_c is not None:
                 # Apply terrain mask
-                if surface_pressure is not None:
+                if terrain_mask is not None:
                     temp_c = temp_c.copy()
-                    for i in range(n_points):
-                        sp = surface_pressure[i]
-                        for lev_idx, plev in enumerate(pressure_levels):
-                            if plev > sp:
-                                temp_c[lev_idx, i] = np.nan
+                    temp_c[terrain_mask] = np.nan
 
                 temp_levels = np.arange(-60, 45, 5)
                 cf = ax.contourf(X, Y, temp_c, levels=temp_levels, cmap='coolwarm', extend='both')
@@ -598,13 +585,9 @@ def create_production_cross_section(
             theta_e = data.get('theta_e')
             if theta_e is not None:
                 # Apply terrain mask
-                if surface_pressure is not None:
+                if terrain_mask is not None:
                     theta_e = theta_e.copy()
-                    for i in range(n_points):
-                        sp = surface_pressure[i]
-                        for lev_idx, plev in enumerate(pressure_levels):
-                            if plev > sp:
-                                theta_e[lev_idx, i] = np.nan
+                    theta_e[terrain_mask] = np.nan
 
                 theta_e_levels = np.arange(280, 365, 4)
                 cf = ax.contourf(X, Y, theta_e, levels=theta_e_levels, cmap='Spectral_r', extend='both')
@@ -619,13 +602,9 @@ def create_production_cross_section(
             q = data.get('specific_humidity')
             if q is not None:
                 # Apply terrain mask
-                if surface_pressure is not None:
+                if terrain_mask is not None:
                     q = q.copy()
-                    for i in range(n_points):
-                        sp = surface_pressure[i]
-                        for lev_idx, plev in enumerate(pressure_levels):
-                            if plev > sp:
-                                q[lev_idx, i] = np.nan
+                    q[terrain_mask] = np.nan
 
                 # Convert kg/kg to g/kg
                 q_display = q * 1000
@@ -651,13 +630,9 @@ def create_production_cross_section(
             cloud_total = data.get('cloud_total')
             if cloud_total is not None:
                 # Apply terrain mask
-                if surface_pressure is not None:
+                if terrain_mask is not None:
                     cloud_total = cloud_total.copy()
-                    for i in range(n_points):
-                        sp = surface_pressure[i]
-                        for lev_idx, plev in enumerate(pressure_levels):
-                            if plev > sp:
-                                cloud_total[lev_idx, i] = np.nan
+                    cloud_total[terrain_mask] = np.nan
 
                 ct_colors = ['#FFFFFF', '#E8E8F0', '#C0C0E0', '#8888CC', '#5050AA', '#303088', '#101066']
                 ct_cmap = mcolors.LinearSegmentedColormap.from_list('cloud_total', ct_colors, N=256)
@@ -674,13 +649,9 @@ def create_production_cross_section(
             shear = data.get('shear')
             if shear is not None:
                 # Apply terrain mask
-                if surface_pressure is not None:
+                if terrain_mask is not None:
                     shear = shear.copy()
-                    for i in range(n_points):
-                        sp = surface_pressure[i]
-                        for lev_idx, plev in enumerate(pressure_levels):
-                            if plev > sp:
-                                shear[lev_idx, i] = np.nan
+                    shear[terrain_mask] = np.nan
 
                 shear_levels = np.linspace(0, 10, 11)
                 cf = ax.contourf(X, Y, shear, levels=shear_levels, cmap='OrRd', extend='max')
@@ -695,13 +666,9 @@ def create_production_cross_section(
             wetbulb = data.get('wetbulb')
             if wetbulb is not None:
                 # Apply terrain mask
-                if surface_pressure is not None:
+                if terrain_mask is not None:
                     wetbulb = wetbulb.copy()
-                    for i in range(n_points):
-                        sp = surface_pressure[i]
-                        for lev_idx, plev in enumerate(pressure_levels):
-                            if plev > sp:
-                                wetbulb[lev_idx, i] = np.nan
+                    wetbulb[terrain_mask] = np.nan
 
                 wb_levels = np.arange(-30, 35, 5)
                 cf = ax.contourf(X, Y, wetbulb, levels=wb_levels, cmap='coolwarm', extend='both')
@@ -723,13 +690,9 @@ def create_production_cross_section(
             icing = data.get('icing')
             if icing is not None:
                 # Apply terrain mask
-                if surface_pressure is not None:
+                if terrain_mask is not None:
                     icing = icing.copy()
-                    for i in range(n_points):
-                        sp = surface_pressure[i]
-                        for lev_idx, plev in enumerate(pressure_levels):
-                            if plev > sp:
-                                icing[lev_idx, i] = np.nan
+                    icing[terrain_mask] = np.nan
 
                 # Purple gradient for icing severity
                 icing_colors = ['#FFFFFF', '#E8D8F0', '#D0B0E0', '#B080D0', '#9050C0', '#7020B0', '#500090']
@@ -757,13 +720,9 @@ def create_production_cross_section(
             lapse = data.get('lapse_rate')
             if lapse is not None:
                 # Apply terrain mask
-                if surface_pressure is not None:
+                if terrain_mask is not None:
                     lapse = lapse.copy()
-                    for i in range(n_points):
-                        sp = surface_pressure[i]
-                        for lev_idx, plev in enumerate(pressure_levels):
-                            if plev > sp:
-                                lapse[lev_idx, i] = np.nan
+                    lapse[terrain_mask] = np.nan
 
                 # Diverging colormap: blue (stable < 6) -> white (neutral ~6-7) -> red (unstable > 7)
                 lapse_levels = np.arange(0, 12.5, 0.5)
@@ -896,8 +855,8 @@ def create_production_cross_section(
                 import cartopy.crs as ccrs
                 import cartopy.feature as cfeature
 
-                lon_min, lon_max = min(lons) - 3, max(lons) + 3
-                lat_min, lat_max = min(lats) - 2, max(lats) + 2
+                lon_min, lon_max = float(lons.min()) - 3, float(lons.max()) + 3
+                lat_min, lat_max = float(lats.min()) - 2, float(lats.max()) + 2
 
                 axins = fig.add_axes([0.08, 0.82, 0.25, 0.16],
                                      projection=ccrs.PlateCarree())
@@ -1058,17 +1017,11 @@ def _calculate_distances(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
     """Calculate cumulative distance along path in km."""
     R = 6371  # Earth radius
 
-    distances = [0]
-    for i in range(1, len(lats)):
-        lat1, lon1 = np.radians(lats[i-1]), np.radians(lons[i-1])
-        lat2, lon2 = np.radians(lats[i]), np.radians(lons[i])
-
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-
-        a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
-        c = 2 * np.arcsin(np.sqrt(a))
-
-        distances.append(distances[-1] + R * c)
-
-    return np.array(distances)
+    # Haversine for all consecutive pairs at once, then cumulative sum
+    lat = np.radians(lats)
+    lon = np.radians(lons)
+    a = (np.sin(np.diff(lat) / 2) ** 2
+         + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(np.diff(lon) / 2) ** 2)
+    distances = np.zeros(len(lat))
+    np.cumsum(2 * R * np.arcsin(np.sqrt(a)), out=distances[1:])
+    return distances
@@ -1,6 +1,7 @@
 """GRIB data loading module with multiple strategies"""
 
 import os
+import re
 import warnings
 import tempfile
 import subprocess
@@ -100,19 +101,15 @@ def load_field_data_original(grib_file, field_name, field_config):
                 temp_nc = tmp_file.name
             
             try:
-                # Find COLMD record
-                result = subprocess.run(['wgrib2', str(grib_file), '-s'], capture_output=True, text=True)
-                colmd_record = None
-                for line in result.stdout.strip().split('\n'):
-                    if 'COLMD' in line:
-                        colmd_record = line.split(':')[0]
-                        break
-                
+                # Find and extract the first COLMD record to NetCDF in a single
+                # wgrib2 run (-match filters the inventory, -end stops after it)
+                result = subprocess.run(
+                    ['wgrib2', str(grib_file), '-match', 'COLMD', '-netcdf', temp_nc, '-end'],
+                    capture_output=True, text=True, check=True)
+                # wgrib2 echoes the inventory line of each matched record
+                colmd_record = re.match(r'[\d.]+', result.stdout)
+
                 if colmd_record:
-                    # Extract to NetCDF
-                    subprocess.run(['wgrib2', str(grib_file), '-d', colmd_record, '-netcdf', temp_nc], 
-                                 capture_output=True, text=True, check=True)
-                    
                     # Load the NetCDF file
                     ds = xr.open_dataset(temp_nc)
                     print(f"🔍 COLMD variables available: {list(ds.data_vars.keys())}")
@@ -170,22 +167,23 @@ def load_field_data_original(grib_file, field_name, field_config):
             print(f"Reduced dimension {extra_dim} to 2D")
         
         # Apply transformations
-        if field_config.get('transform') == 'abs':
+        transform = field_config.get('transform')
+        if transform == 'abs':
             data = abs(data)
-        elif field_config.get('transform') == 'celsius':
+        elif transform == 'celsius':
             data = data - 273.15  # Kelvin to Celsius
-        elif field_config.get('transform') == 'mb':
+        elif transform == 'mb':
             data = data / 100  # Pa to mb
-        elif field_config.get('transform') == 'smoke_concentration':
+        elif transform == 'smoke_concentration':
             # Convert from kg/m³ to μg/m³ (HRRR changed units in Dec 2021)
             data = data * 1e9  # kg/m³ to μg/m³
-        elif field_config.get('transform') == 'smoke_column':
+        elif transform == 'smoke_column':
             # Convert column mass to mg/m²
             data = data * 1e6  # kg/m² to mg/m²
-        elif field_config.get('transform') == 'dust_concentration':
+        elif transform == 'dust_concentration':
             # Convert dust concentration from kg/m³ to μg/m³
             data = data * 1e9  # kg/m³ to μg/m³
-        elif field_config.get('transform') == 'prate_units':
+        elif transform == 'prate_units':
             # Convert precipitation rate from kg/m²/s to mm/hr
             data = data * 3600  # kg/m²/s to mm/hr
         
@@ -212,6 +210,10 @@ def load_field_data_multids(grib_file, field_name, field_config, model_name):
             datasets = cfgrib.open_datasets(grib_file, backend_kwargs=backend_kwargs)
         
         print(f"🔍 Searching {var_name} across {len(datasets)} datasets...")
+
+        # Normalized names for the 'unknown' fallback, built once rather than per dataset
+        var_lower = var_name.lower()
+        grib_shortname_match = field_config.get('grib_shortname_match', '').lower()
         
         # Search across all datasets for our variable
         for i, ds in enumerate(datasets):
@@ -240,14 +242,12 @@ def load_field_data_multids(grib_file, field_name, field_config, model_name):
                     if hasattr(unknown_var, 'attrs'):
                         grib_name = unknown_var.attrs.get('GRIB_shortName', '')
                         grib_param_name = unknown_var.attrs.get('GRIB_parameterName', '')
+                        grib_name_lower = grib_name.lower()
                         
                         # Check both shortName and parameterName for matches
-                        var_lower = var_name.lower()
-                        grib_shortname_match = field_config.get('grib_shortname_match', '').lower()
-                        
-                        if (grib_name.lower() == var_lower or 
+                        if (grib_name_lower == var_lower or 
                             grib_param_name.lower().replace(' ', '_') == var_lower or
-                            (grib_shortname_match and grib_name.lower() == grib_shortname_match)):
+                            (grib_shortname_match and grib_name_lower == grib_shortname_match)):
                             print(f"✅ Found {var_name} as 'unknown' in dataset {i} (GRIB: {grib_name})")
                             data = unknown_var
                             
@@ -321,7 +321,7 @@ def load_field_with_wgrib2(grib_file, field_config):
             
             # If no direct match, return the first variable
             if len(ds.data_vars) > 0:
-                first_var = list(ds.data_vars.keys())[0]
+                first_var = next(iter(ds.data_vars))
                 print(f"✅ Using first available variable '{first_var}' for {var_name}")
                 # Load data into memory immediately
                 data = ds[first_var].load()
@@ -373,7 +373,7 @@ def load_uh_layer(path, top, bottom):
                     }
                 )
                 # Get the variable (should be single variable with paramId)
-                var_name = list(ds.data_vars)[0]
+                var_name = next(iter(ds.data_vars))
                 uh_data = ds[var_name]
                 
                 # Check if we loaded the wrong variable (max_vo instead of MXUPHL)
@@ -397,10 +397,12 @@ def load_uh_layer(path, top, bottom):
                         elif dim not in dims_to_keep:
                             # For non-spatial dimensions with size > 1, take the first slice
                             uh_data = uh_data.isel({dim: 0})
+                            # Slicing dropped data, so the max above no longer applies
+                            data_max = float(uh_data.max().values)
                 
                 print(f"✅ Loaded UH {bottom}-{top}m layer via paramId from {path}")
                 print(f"   Data shape: {uh_data.shape}, dims: {uh_data.dims}")
-                print(f"   Data range: {uh_data.min().values:.1f} to {uh_data.max().values:.1f}")
+                print(f"   Data range: {float(uh_data.min().values):.1f} to {data_max:.1f}")
                 return uh_data
             except Exception as e:
                 print(f"⚠️ paramId approach failed: {e}")
@@ -426,7 +428,7 @@ def load_uh_layer(path, top, bottom):
                     if result.returncode == 0:
                         # Load the extracted data
                         ds = xr.open_dataset(tmp.name, engine="cfgrib")
-                        var_name = list(ds.data_vars)[0]
+                        var_name = next(iter(ds.data_vars))
                         uh_data = ds[var_name]
                         
                         # Ensure 2D data for plotting (squeeze out extra dims)
@@ -499,25 +501,26 @@ def _apply_data_transformations(data, field_config):
         print(f"Reduced dimension {extra_dim} to 2D")
     
     # Apply transformations
-    if field_config.get('transform') == 'abs':
+    transform = field_config.get('transform')
+    if transform == 'abs':
         data = abs(data)
-    elif field_config.get('transform') == 'celsius':
+    elif transform == 'celsius':
         data = data - 273.15  # Kelvin to Celsius
-    elif field_config.get('transform') == 'mb':
+    elif transform == 'mb':
         data = data / 100  # Pa to mb
-    elif field_config.get('transform') == 'smoke_concentration':
+    elif transform == 'smoke_concentration':
         # Convert from kg/m³ to μg/m³ (HRRR changed units in Dec 2021)
         data = data * 1e9  # kg/m³ to μg/m³
-    elif field_config.get('transform') == 'smoke_column':
+    elif transform == 'smoke_column':
         # Convert column mass to mg/m²
         data = data * 1e6  # kg/m² to mg/m²
-    elif field_config.get('transform') == 'dust_concentration':
+    elif transform == 'dust_concentration':
         # Convert dust concentration from kg/m³ to μg/m³
         data = data * 1e9  # kg/m³ to μg/m³
-    elif field_config.get('transform') == 'prate_units':
+    elif transform == 'prate_units':
         # Convert precipitation rate from kg/m²/s to mm/hr
         data = data * 3600  # kg/m²/s to mm/hr
-    elif field_config.get('transform') == 'hail_size':
+    elif transform == 'hail_size':
         # Convert hail diameter from m to mm 
         data = data * 1000  # m to mm
     
@@ -534,15 +537,14 @@ def _select_layer(data, layer_config):
             bottom = layer_config.get('bottom', 0)
             top = layer_config.get('top', 3000)
             
-            # Find matching layer - HRRR uses top value as identifier
-            for i, layer_val in enumerate(layer_values):
-                if layer_val == top:
-                    print(f"✅ Selected layer {top}m (index {i})")
-                    return data.isel(heightAboveGroundLayer=i)
-            
-            # If exact match not found, try closest
-            closest_idx = np.argmin(np.abs(layer_values - top))
-            print(f"⚠️ Exact layer {top}m not found, using closest: {layer_values[closest_idx]}m")
+            # Find matching layer - HRRR uses top value as identifier.
+            # One argmin covers both cases: an exact match is the closest
+            # layer at distance 0 (first occurrence, as the old scan returned)
+            closest_idx = int(np.argmin(np.abs(layer_values - top)))
+            if layer_values[closest_idx] == top:
+                print(f"✅ Selected layer {top}m (index {closest_idx})")
+            else:
+                print(f"⚠️ Exact layer {top}m not found, using closest: {layer_values[closest_idx]}m")
             return data.isel(heightAboveGroundLayer=closest_idx)
                     
         elif isinstance(layer_config, int):
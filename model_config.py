@@ -5,6 +5,7 @@ Handles configuration for different weather models (HRRR, RRFS, etc.)
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
@@ -213,8 +214,9 @@ class ModelRegistry:
         }
 
 
+@lru_cache(maxsize=1)
 def get_model_registry() -> ModelRegistry:
-    """Get the global model registry instance"""
+    """Get the global model registry instance (built once per process)"""
     return ModelRegistry()
 
 
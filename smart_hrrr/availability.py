@@ -1,12 +1,29 @@
 from datetime import datetime, timedelta
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+import http.client
+import threading
 import urllib.request
 
 
-def check_cycle_availability(cycle: str, model: str = "hrrr") -> bool:
-    """Check if a cycle is available by testing F00 file"""
+def _close_all(conns: Dict[tuple, http.client.HTTPConnection]) -> None:
+    for conn in conns.values():
+        conn.close()
+    conns.clear()
+
+
+def check_cycle_availability(cycle: str, model: str = "hrrr",
+                             conns: Optional[Dict[tuple, http.client.HTTPConnection]] = None) -> bool:
+    """Check if a cycle is available by testing F00 file.
+
+    Pass a shared ``conns`` dict to reuse one connection across probes.
+    """
+    owned = conns is None
+    if owned:
+        conns = {}
     try:
         from model_config import get_model_registry
+        from .orchestrator import _head_ok
         
         reg = get_model_registry()
         model_cfg = reg.get_model(model.lower())
@@ -22,12 +39,13 @@ def check_cycle_availability(cycle: str, model: str = "hrrr") -> bool:
         if not urls:
             return False
         
-        req = urllib.request.Request(urls[0])
-        req.get_method = lambda: "HEAD"
-        resp = urllib.request.urlopen(req, timeout=10)
-        return resp.getcode() == 200
+        # Same probe (stale-socket retry, GRIB size floor) the downloader trusts
+        return _head_ok(urls[0], 10, conns)
     except Exception:
         return False
+    finally:
+        if owned:
+            _close_all(conns)
 
 
 def get_latest_cycle(model: str = "hrrr") -> Tuple[Optional[str], Optional[datetime]]:
@@ -41,16 +59,50 @@ def get_latest_cycle(model: str = "hrrr") -> Tuple[Optional[str], Optional[datet
     except Exception:
         model_cfg = None
 
+    candidates = []
     for back in range(0, 12):
         t = now - timedelta(hours=back)
-        cyc = t.strftime("%Y%m%d%H")
-        
         if model_cfg and hasattr(model_cfg, "forecast_cycles"):
             if t.hour not in model_cfg.forecast_cycles:
                 continue
-        
-        if check_cycle_availability(cyc, model):
-            return cyc, t
+        candidates.append((t.strftime("%Y%m%d%H"), t))
+
+    # Probe newest-first on a few workers: worker k takes candidates k, k+W, ...
+    # over its own keep-alive connections, so at most W HEADs are in flight and
+    # older cycles are only probed while newer ones are unresolved. The newest
+    # candidate that answered wins; leftover probes are abandoned, not awaited.
+    if candidates:
+        n_workers = min(3, len(candidates))
+        found = [False] * len(candidates)
+        ready = [threading.Event() for _ in candidates]
+        stop = threading.Event()
+
+        def probe_stripe(k: int) -> None:
+            conns: Dict[tuple, http.client.HTTPConnection] = {}
+            try:
+                for i in range(k, len(candidates), n_workers):
+                    if stop.is_set():
+                        break
+                    found[i] = check_cycle_availability(candidates[i][0], model, conns)
+                    ready[i].set()
+                    if found[i]:
+                        break  # The rest of this stripe is older
+            finally:
+                _close_all(conns)
+                for i in range(k, len(candidates), n_workers):
+                    ready[i].set()  # Unblock the walk below past skipped cycles
+
+        pool = ThreadPoolExecutor(max_workers=n_workers)
+        try:
+            for k in range(n_workers):
+                pool.submit(probe_stripe, k)
+            for i, (cyc, t) in enumerate(candidates):
+                ready[i].wait()
+                if found[i]:
+                    return cyc, t
+        finally:
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
 
     fallback = now - timedelta(hours=6)
     return fallback.strftime("%Y%m%d%H"), fallback
@@ -25,6 +25,26 @@ def get_forecast_hour_dir(run_dir: Path, forecast_hour: int) -> Path:
     return fhr_dir
 
 
+def dir_size_bytes(path) -> int:
+    """Sum file sizes under path using os.scandir (DirEntry caches stat info)."""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
 def get_grib_download_dir(cycle: str, model: str = "hrrr") -> Path:
     """Get centralized GRIB download directory"""
     from datetime import datetime
@@ -17,8 +17,11 @@ Usage:
 """
 
 import argparse
+import fnmatch
+import heapq
 import json
 import logging
+import os
 import sys
 import time
 import signal
@@ -31,6 +34,7 @@ from datetime import datetime, timedelta, timezone
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from model_config import get_model_registry
+from smart_hrrr.io import dir_size_bytes
 
 logging.basicConfig(
     level=logging.INFO,
@@ -151,14 +155,25 @@ def get_downloaded_fhrs(model, date_str, hour, max_fhr=None):
     run_dir = base_dir / date_str / f"{hour:02d}z"
     patterns = MODEL_REQUIRED_PATTERNS.get(model, ['*.grib2'])
 
+    # One listing of the run dir, then one listing per FHR dir matched in
+    # memory -- avoids a stat per FHR plus a directory scan per pattern.
+    try:
+        fhr_dirs = {e.name for e in os.scandir(run_dir) if e.is_dir()}
+    except OSError:
+        return []
+
     fhrs_to_check = get_model_fhrs(model, max_fhr)
     downloaded = []
     for fhr in fhrs_to_check:
-        fhr_dir = run_dir / f"F{fhr:02d}"
-        if not fhr_dir.exists():
+        name = f"F{fhr:02d}"
+        if name not in fhr_dirs:
+            continue
+        try:
+            files = os.listdir(run_dir / name)
+        except OSError:
             continue
         # All required patterns must have at least one match
-        if all(list(fhr_dir.glob(p)) for p in patterns):
+        if all(fnmatch.filter(files, p) for p in patterns):
             downloaded.append(fhr)
     return downloaded
 
@@ -286,22 +301,17 @@ def get_disk_usage_gb(model='hrrr'):
     base_dir = get_base_dir(model)
     if not base_dir.exists():
         return 0
-    total = sum(f.stat().st_size for f in base_dir.rglob("*") if f.is_file())
-    return total / (1024 ** 3)
+    return dir_size_bytes(base_dir) / (1024 ** 3)
 
 def load_disk_meta():
-    if DISK_META_FILE.exists():
-        try:
-            with open(DISK_META_FILE) as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
+    try:
+        return json.loads(DISK_META_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
 
 def save_disk_meta(meta):
     DISK_META_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(DISK_META_FILE, 'w') as f:
-        json.dump(meta, f, indent=2)
+    DISK_META_FILE.write_text(json.dumps(meta))
 
 def cleanup_disk_if_needed(model='hrrr'):
     """Evict least-popular cycles if disk usage exceeds limit.
@@ -341,14 +351,16 @@ def cleanup_disk_if_needed(model='hrrr'):
                 continue
             disk_cycles.append((last_access, cycle_key, hour_dir))
 
-    disk_cycles.sort()  # Oldest access first
+    heapq.heapify(disk_cycles)  # Oldest access first, popped only as needed
 
-    for last_access, cycle_key, hour_dir in disk_cycles:
-        if get_disk_usage_gb(model) <= target:
-            break
+    # Track usage as cycles are evicted instead of re-walking the whole tree
+    while disk_cycles and usage > target:
+        last_access, cycle_key, hour_dir = heapq.heappop(disk_cycles)
         logger.info(f"[{model.upper()}] Disk evict: {cycle_key} (last accessed {int((now - last_access)/3600)}h ago)")
         try:
+            freed = dir_size_bytes(hour_dir)
             shutil.rmtree(hour_dir)
+            usage -= freed / (1024 ** 3)
             parent = hour_dir.parent
             if parent.exists() and not any(parent.iterdir()):
                 parent.rmdir()
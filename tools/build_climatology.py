@@ -160,15 +160,17 @@ def accumulate_mean(running_sum, running_count, new_data):
         if field_name not in new_data or new_data[field_name] is None:
             continue
 
-        arr = new_data[field_name].astype(np.float64)
+        arr = new_data[field_name]
 
         if field_name not in running_sum:
-            running_sum[field_name] = np.zeros_like(arr, dtype=np.float64)
+            running_sum[field_name] = np.zeros(arr.shape, dtype=np.float64)
             running_count[field_name] = np.zeros(arr.shape, dtype=np.int32)
 
+        # One finite mask drives both updates in place: no float64 copy of the
+        # field and no gather/scatter through boolean fancy indexing
         mask = np.isfinite(arr)
-        running_sum[field_name][mask] += arr[mask]
-        running_count[field_name][mask] += 1
+        np.add(running_sum[field_name], arr, out=running_sum[field_name], where=mask)
+        running_count[field_name] += mask
 
 
 def finalize_mean(running_sum, running_count):
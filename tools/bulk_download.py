@@ -29,18 +29,15 @@ Directory structure matches the dashboard layout:
 
 import argparse
 import logging
-import socket
 import sys
 import time
-import urllib.request
-import urllib.error
 from datetime import datetime, timedelta
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from smart_hrrr.orchestrator import download_forecast_hour
+from smart_hrrr.orchestrator import download_forecast_hour, download_grib_file
 from model_config import get_model_registry
 
 logging.basicConfig(
@@ -87,16 +84,15 @@ def count_existing(output_dir, date_str, hour, fhrs, file_types):
 
 
 def download_file_direct(url, output_path, timeout=600):
-    """Download a file directly from a URL (no source fallback)."""
-    partial_path = Path(str(output_path) + '.partial')
-    try:
-        socket.setdefaulttimeout(timeout)
-        urllib.request.urlretrieve(url, partial_path)
-        partial_path.rename(output_path)
-        return True
-    except (urllib.error.URLError, socket.timeout, OSError):
-        partial_path.unlink(missing_ok=True)
-        return False
+    """Download a file directly from a URL (no source fallback).
+
+    Goes through the orchestrator's per-thread keep-alive connections, so a
+    worker pulling every FHR of a cycle from AWS reuses one TLS session
+    instead of handshaking per file. ``timeout`` is the idle limit in seconds
+    on each read after the request is sent (headers and body chunks), not a
+    cap on the whole transfer; connecting is capped at CONNECT_TIMEOUT.
+    """
+    return download_grib_file(url, output_path, timeout=timeout)
 
 
 def download_init(output_dir, date_str, hour, fhrs, file_types, max_threads=4, aws_only=False):
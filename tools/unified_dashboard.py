@@ -11,26 +11,38 @@ Usage:
 """
 
 import argparse
+import base64
+import bisect
+import fnmatch
+import heapq
 import json
 import logging
 import os
 import sys
+import tempfile
 import time
 import io
 import threading
 from pathlib import Path
 from datetime import datetime
 from functools import wraps
-from collections import defaultdict
+from operator import itemgetter
+from collections import OrderedDict, defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import imageio.v2 as imageio
 from PIL import Image
 
 from flask import Flask, jsonify, request, send_file, abort
 
+try:
+    import orjson  # Optional: faster encoding of the multi-MB /api/frames payload
+except ImportError:
+    orjson = None
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from smart_hrrr.io import dir_size_bytes
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)s | %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -196,19 +208,17 @@ def delete_favorite(fav_id):
 
 def load_disk_meta():
     """Load disk metadata (last-accessed times, request source)."""
-    if DISK_META_FILE.exists():
-        try:
-            with open(DISK_META_FILE) as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
+    try:
+        return json.loads(DISK_META_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
 
 def save_disk_meta(meta):
     """Save disk metadata."""
     DISK_META_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(DISK_META_FILE, 'w') as f:
-        json.dump(meta, f, indent=2)
+    # One-shot dumps without indent runs the C encoder and issues one write;
+    # json.dump(f, indent=2) walks the pure-Python encoder chunk by chunk.
+    DISK_META_FILE.write_text(json.dumps(meta))
 
 def touch_cycle_access(cycle_key):
     """Mark a cycle as recently accessed (for popularity tracking)."""
@@ -224,8 +234,7 @@ def get_disk_usage_gb():
     base = Path("outputs/hrrr")
     if not base.exists():
         return 0
-    total = sum(f.stat().st_size for f in base.rglob("*") if f.is_file())
-    return total / (1024 ** 3)
+    return dir_size_bytes(base) / (1024 ** 3)
 
 def disk_evict_least_popular(target_gb=None):
     """Evict least-recently-accessed cycles from disk until under target_gb.
@@ -263,15 +272,18 @@ def disk_evict_least_popular(target_gb=None):
                 continue  # Skip recently used
             disk_cycles.append((last_access, cycle_key, hour_dir))
 
-    # Sort by last access (oldest first = evict first)
-    disk_cycles.sort()
+    # Min-heap on last access (oldest first = evict first). Eviction usually
+    # stops after a few cycles, so pop lazily instead of sorting everything
+    heapq.heapify(disk_cycles)
 
-    for last_access, cycle_key, hour_dir in disk_cycles:
-        if get_disk_usage_gb() <= target_gb:
-            break
+    # Track usage as cycles are evicted instead of re-walking the whole tree
+    while disk_cycles and usage > target_gb:
+        last_access, cycle_key, hour_dir = heapq.heappop(disk_cycles)
         logger.info(f"Disk evict: {cycle_key} (last accessed {int((now - last_access)/3600)}h ago)")
         try:
+            freed = dir_size_bytes(hour_dir)
             shutil.rmtree(hour_dir)
+            usage -= freed / (1024 ** 3)
             # Clean up empty parent date dir
             parent = hour_dir.parent
             if parent.exists() and not any(parent.iterdir()):
@@ -290,7 +302,7 @@ def get_cache_usage_gb(managers: dict) -> float:
     for model_name, mgr in managers.items():
         cache_dir = Path(mgr.CACHE_BASE) / model_name
         if cache_dir.exists():
-            total += sum(f.stat().st_size for f in cache_dir.rglob("*") if f.is_file())
+            total += dir_size_bytes(cache_dir)
     return total / (1024 ** 3)
 
 
@@ -382,15 +394,19 @@ def cache_evict_old_cycles(managers: dict):
             evictable.append((ck, entry, model_name))
 
     # Sort by cycle key (oldest first)
-    evictable.sort(key=lambda x: x[0])
+    evictable.sort(key=itemgetter(0))
 
+    # Track usage from the bytes each eviction frees instead of re-walking the
+    # whole cache tree after every removal
+    import shutil
     removed_keys = set()
     for ck, d, model_name in evictable:
-        if get_cache_usage_gb(managers) <= target_gb:
+        if usage_gb <= target_gb:
             break
+        size_bytes = dir_size_bytes(d)
         try:
-            import shutil
             shutil.rmtree(d)
+            usage_gb -= size_bytes / (1024 ** 3)
         except Exception as e:
             logger.warning(f"Cache evict failed for {d.name}: {e}")
         if ck not in removed_keys:
@@ -441,12 +457,15 @@ class RateLimiter:
     def is_allowed(self, ip):
         now = time.time()
         with self.lock:
-            self.requests[ip] = [t for t in self.requests[ip] if t > now - 60]
-            if len(self.requests[ip]) >= self.rpm:
+            # Timestamps are appended in order, so both windows are suffixes
+            # of the list: bisect for the cut instead of filtering/copying it
+            times = self.requests[ip]
+            del times[:bisect.bisect_right(times, now - 60)]
+            if len(times) >= self.rpm:
                 return False
-            if len([t for t in self.requests[ip] if t > now - 1]) >= self.burst:
+            if len(times) - bisect.bisect_right(times, now - 1) >= self.burst:
                 return False
-            self.requests[ip].append(now)
+            times.append(now)
             return True
 
 rate_limiter = RateLimiter()
@@ -455,30 +474,50 @@ rate_limiter = RateLimiter()
 # 12 = up to 8 prerender workers + 4 live user requests
 RENDER_SEMAPHORE = threading.Semaphore(12)
 PRERENDER_WORKERS = 8  # Parallel threads for batch prerender
+GIF_WORKERS = 3        # Parallel frame renders per GIF request (< the 4 live slots)
+GIF_SPOOL_BYTES = 8 * 1024 * 1024  # Encoded GIFs larger than this go to a temp file
 
 # =============================================================================
 # FRAME PRERENDER CACHE — stores rendered PNG bytes for slider/comparison
 # =============================================================================
-FRAME_CACHE = {}            # cache_key -> PNG bytes
+FRAME_CACHE = OrderedDict()  # cache_key -> PNG bytes, least recently used first
 FRAME_CACHE_LOCK = threading.Lock()
 MAX_FRAME_CACHE = 500       # ~500 * 150KB = ~75MB max
+# One-off /api/xsect renders live apart, so ordinary clicking can't evict
+# prerendered batches before /api/frames collects them
+VIEW_CACHE = OrderedDict()
+MAX_VIEW_CACHE = 64
+MAX_FRAMES_PER_FETCH = 150  # /api/frames batch cap (~22MB of base64 PNGs)
 
 def frame_cache_key(model, cycle_key, fhr, style, start, end, y_axis, vscale, y_top, units, temp_cmap, anomaly):
     """Deterministic cache key for a rendered frame."""
-    return f"{model}:{cycle_key}:F{fhr:02d}:{style}:{start[0]:.4f},{start[1]:.4f}:{end[0]:.4f},{end[1]:.4f}:{y_axis}:{vscale}:{y_top}:{units}:{temp_cmap}:{anomaly}"
+    return frame_cache_key_for_view(
+        model, cycle_key, fhr,
+        frame_view_key(style, start, end, y_axis, vscale, y_top, units, temp_cmap, anomaly))
+
+def frame_view_key(style, start, end, y_axis, vscale, y_top, units, temp_cmap, anomaly):
+    """View part of a frame cache key; build once per batch, reuse for every frame."""
+    return f"{style}:{start[0]:.4f},{start[1]:.4f}:{end[0]:.4f},{end[1]:.4f}:{y_axis}:{vscale}:{y_top}:{units}:{temp_cmap}:{anomaly}"
 
-def frame_cache_put(key, png_bytes):
-    """Store a rendered frame, evicting oldest if full."""
+def frame_cache_key_for_view(model, cycle_key, fhr, view_key):
+    """Frame cache key from a precomputed frame_view_key()."""
+    return f"{model}:{cycle_key}:F{fhr:02d}:{view_key}"
+
+def frame_cache_put(key, png_bytes, cache=FRAME_CACHE, limit=MAX_FRAME_CACHE):
+    """Store a rendered frame, evicting the least recently used if full."""
     with FRAME_CACHE_LOCK:
-        FRAME_CACHE[key] = png_bytes
-        while len(FRAME_CACHE) > MAX_FRAME_CACHE:
-            oldest = next(iter(FRAME_CACHE))
-            del FRAME_CACHE[oldest]
+        cache[key] = png_bytes
+        cache.move_to_end(key)
+        while len(cache) > limit:
+            cache.popitem(last=False)
 
-def frame_cache_get(key):
-    """Retrieve cached frame or None."""
+def frame_cache_get(key, cache=FRAME_CACHE):
+    """Retrieve cached frame (marking it recently used) or None."""
     with FRAME_CACHE_LOCK:
-        return FRAME_CACHE.get(key)
+        png = cache.get(key)
+        if png is not None:
+            cache.move_to_end(key)
+        return png
 
 # Admin key for archive access — set via WXSECTION_KEY env var
 ADMIN_KEY = os.environ.get('WXSECTION_KEY', '')
@@ -678,13 +717,16 @@ class CrossSectionManager:
         self.xsect = None
         self.base_dir = Path(f"outputs/{model_name}")
         self.available_cycles = []  # List of available cycles (metadata only)
+        self._cycles_by_key = {}  # cycle_key -> entry of available_cycles
         self.loaded_cycles = set()  # Cycle keys that are fully loaded
-        self.loaded_items = []  # List of (cycle_key, fhr) currently in memory (ordered by load time = LRU)
+        self.loaded_items = {}  # (cycle_key, fhr) -> None for items in memory; dict order = load time (LRU), O(1) membership
         self.current_cycle = None  # Currently selected cycle
         self._lock = threading.Lock()  # Protects all state mutations
         self._loading = threading.Lock()  # Prevents overlapping bulk loads (preload vs load_cycle)
         self._engine_key_map = {}  # (cycle_key, fhr) -> unique engine int key
         self._next_engine_key = 0  # Counter for unique keys
+        self._terrain_cache = {}  # (engine_key, start, end) -> terrain dict, insertion-ordered
+        self._terrain_cache_lock = threading.Lock()
         # Model-specific config
         self._prs_pattern = MODEL_PRS_PATTERNS.get(model_name, '*.grib2')
         self._sfc_pattern = MODEL_SFC_PATTERNS.get(model_name, '*.grib2')
@@ -727,6 +769,7 @@ class CrossSectionManager:
     #        Keep previous synoptic during handoff until new one is ready.
     # GFS/RRFS: newest cycle only; keep previous during handoff.
     HRRR_HOURLY_CYCLES = 3   # Number of recent hourly cycles to keep
+    TERRAIN_CACHE_MAX = 32    # Terrain profiles kept for GIF/prerender paths
     GFS_CYCLES = 1            # GFS cycles to keep (+ 1 during handoff)
     RRFS_CYCLES = 1           # RRFS cycles to keep (+ 1 during handoff)
 
@@ -754,31 +797,29 @@ class CrossSectionManager:
           3. N most recent hourly cycles
         Only one synoptic cycle is kept — no previous synoptic handoff.
         """
-        targets = []
-        seen = set()
-
         newest = self.available_cycles[0]  # Overall newest init
-        synoptics = [c for c in self.available_cycles if c.get('is_synoptic')]
+        need_synoptic = not newest.get('is_synoptic')
+        synoptic = None
+        hourlies = []
+
+        # Single newest-first pass: pick up the newest synoptic (2) and the
+        # recent hourlies (3) together, stopping as soon as both are settled.
+        for c in self.available_cycles[1:]:
+            if need_synoptic and c.get('is_synoptic'):
+                synoptic = c
+                need_synoptic = False
+            elif len(hourlies) < self.HRRR_HOURLY_CYCLES:
+                hourlies.append(c)
+            if not need_synoptic and len(hourlies) >= self.HRRR_HOURLY_CYCLES:
+                break
 
         # 1. Latest init — always first, period
-        targets.append(newest)
-        seen.add(newest['cycle_key'])
-
+        targets = [newest]
         # 2. Newest synoptic (if it's not already the latest init)
-        if synoptics and synoptics[0]['cycle_key'] not in seen:
-            targets.append(synoptics[0])
-            seen.add(synoptics[0]['cycle_key'])
-
+        if synoptic is not None:
+            targets.append(synoptic)
         # 3. Recent hourly cycles (up to N)
-        count = 0
-        for c in self.available_cycles:
-            if c['cycle_key'] not in seen:
-                targets.append(c)
-                seen.add(c['cycle_key'])
-                count += 1
-                if count >= self.HRRR_HOURLY_CYCLES:
-                    break
-
+        targets.extend(hourlies)
         return targets
 
     def _get_simple_target_cycles(self) -> list:
@@ -821,15 +862,12 @@ class CrossSectionManager:
         mem_mb = self.xsect.get_memory_usage()
         while mem_mb > self.MEM_EVICT_MB and self.loaded_items:
             # Find oldest non-protected item to evict
-            evict_idx = None
-            for i, (ck, fhr) in enumerate(self.loaded_items):
-                if ck not in protected:
-                    evict_idx = i
-                    break
-            if evict_idx is None:
+            evict = next((item for item in self.loaded_items if item[0] not in protected), None)
+            if evict is None:
                 logger.warning(f"Memory {mem_mb:.0f}MB > limit but only protected cycles loaded, cannot evict")
                 break
-            old_key, old_fhr = self.loaded_items.pop(evict_idx)
+            del self.loaded_items[evict]
+            old_key, old_fhr = evict
             logger.info(f"Memory {mem_mb:.0f}MB > {self.MEM_EVICT_MB}MB, evicting {old_key} F{old_fhr:02d}")
             self._unload_item(old_key, old_fhr)
             if not any(k == old_key for k, _ in self.loaded_items):
@@ -870,7 +908,7 @@ class CrossSectionManager:
         cycles = []
 
         if not self.base_dir.exists():
-            self.available_cycles = cycles
+            self._set_available_cycles(cycles)
             return self.available_cycles
 
         # Scan for date directories
@@ -894,20 +932,30 @@ class CrossSectionManager:
                 cycle_hour_int = int(hour)
                 max_fhr = get_max_fhr_for_cycle(self.model_name, cycle_hour_int)
                 expected_fhrs = get_model_fhr_list(self.model_name, cycle_hour_int)
+                # One listing of the cycle dir plus one per FHR dir, matched in
+                # memory (this runs every 30s over every cycle on disk)
+                try:
+                    fhr_dirs = {e.name for e in os.scandir(hour_dir) if e.is_dir()}
+                except OSError:
+                    continue
                 for fhr in expected_fhrs:
-                    fhr_dir = hour_dir / f"F{fhr:02d}"
-                    if fhr_dir.exists():
-                        has_prs = [f for f in fhr_dir.glob(self._prs_pattern)
-                                   if not f.name.endswith('.partial')]
-                        if self._needs_separate_sfc:
-                            has_sfc = [f for f in fhr_dir.glob(self._sfc_pattern)
-                                       if not f.name.endswith('.partial')]
-                            if has_prs and has_sfc:
-                                available_fhrs.append(fhr)
-                        else:
-                            # GFS/RRFS: surface data is in the pressure file
-                            if has_prs:
-                                available_fhrs.append(fhr)
+                    name = f"F{fhr:02d}"
+                    if name not in fhr_dirs:
+                        continue
+                    try:
+                        files = [f for f in os.listdir(hour_dir / name)
+                                 if not f.endswith('.partial')]
+                    except OSError:
+                        continue
+                    has_prs = fnmatch.filter(files, self._prs_pattern)
+                    if self._needs_separate_sfc:
+                        has_sfc = fnmatch.filter(files, self._sfc_pattern)
+                        if has_prs and has_sfc:
+                            available_fhrs.append(fhr)
+                    else:
+                        # GFS/RRFS: surface data is in the pressure file
+                        if has_prs:
+                            available_fhrs.append(fhr)
 
                 if available_fhrs:
                     cycle_key = f"{date_dir.name}_{hour}z"
@@ -926,9 +974,18 @@ class CrossSectionManager:
                         'expected_fhrs': expected_fhrs,
                     })
 
-        self.available_cycles = cycles  # Atomic swap — no empty window
+        self._set_available_cycles(cycles)  # Atomic swap — no empty window
         return self.available_cycles
 
+    def _set_available_cycles(self, cycles):
+        """Publish a new cycle list together with its cycle_key index."""
+        self._cycles_by_key = {c['cycle_key']: c for c in cycles}
+        self.available_cycles = cycles
+
+    def _find_cycle(self, cycle_key):
+        """O(1) lookup of an available cycle's metadata, or None."""
+        return self._cycles_by_key.get(cycle_key)
+
     def get_cycles_for_ui(self):
         """Return cycles formatted for UI dropdown.
 
@@ -939,7 +996,7 @@ class CrossSectionManager:
         Older cycles on disk are hidden until explicitly requested via archive.
         """
         target_keys = {c['cycle_key'] for c in self._get_target_cycles()}
-        loaded_keys = {ck for ck, _ in self.loaded_items}
+        loaded_keys = {ck for ck, _ in list(self.loaded_items)}
 
         # Include cycles with active download/load operations
         # op_id format: "download:hrrr:20250618/15z" or "load:hrrr:20250618/15z"
@@ -1053,7 +1110,7 @@ class CrossSectionManager:
                 if prs_files and self.xsect.load_forecast_hour(str(prs_files[0]), engine_key):
                     with self._lock:
                         if (ck, fhr) not in self.loaded_items:
-                            self.loaded_items.append((ck, fhr))
+                            self.loaded_items[(ck, fhr)] = None
                     return ck, fhr, True
                 return ck, fhr, False
             return _load_one
@@ -1150,12 +1207,20 @@ class CrossSectionManager:
             logger.info(f"  Evicting {ck} F{fhr:02d} (no longer in target cycles)")
             with self._lock:
                 if (ck, fhr) in self.loaded_items:
-                    self.loaded_items.remove((ck, fhr))
+                    del self.loaded_items[(ck, fhr)]
             self._unload_item(ck, fhr)
 
         # Collect all FHRs to load across all target cycles for progress tracking
         all_work = []  # [(cycle, cycle_key, fhr, is_cached)]
         newest = priority_cycles[0] if priority_cycles else None
+
+        # One directory read answers "is this FHR mmap-cached?" for every FHR
+        cache_dir = Path(f'{self.CACHE_BASE}/{self.model_name}')
+        try:
+            with os.scandir(cache_dir) as it:
+                cached_stems = {e.name for e in it if e.is_dir()}
+        except OSError:
+            cached_stems = set()
         for cycle in priority_cycles:
             cycle_key = cycle['cycle_key']
             is_synoptic = cycle.get('is_synoptic', False)
@@ -1175,13 +1240,12 @@ class CrossSectionManager:
             fhrs_to_load = self._priority_sort_fhrs(fhrs_to_load)
 
             # Partition into cached vs uncached
-            cache_dir = Path(f'{self.CACHE_BASE}/{self.model_name}')
             for fhr in fhrs_to_load:
                 prs_files = list((Path(cycle['path']) / f"F{fhr:02d}").glob(self._prs_pattern))
                 is_cached = False
                 if prs_files:
                     stem = self.xsect._get_cache_stem(str(prs_files[0]))
-                    if stem and (cache_dir / stem).is_dir():
+                    if stem and stem in cached_stems:
                         is_cached = True
                 all_work.append((cycle, cycle_key, fhr, is_cached))
 
@@ -1217,7 +1281,7 @@ class CrossSectionManager:
                 if prs_files and self.xsect.load_forecast_hour(str(prs_files[0]), engine_key):
                     with self._lock:
                         if (ck, fhr) not in self.loaded_items:
-                            self.loaded_items.append((ck, fhr))
+                            self.loaded_items[(ck, fhr)] = None
                     return fhr, True
                 return fhr, False
             return _load_one
@@ -1272,7 +1336,7 @@ class CrossSectionManager:
         """Return current memory status."""
         mem_mb = self.xsect.get_memory_usage() if self.xsect else 0
         return {
-            'loaded': self.loaded_items.copy(),
+            'loaded': list(self.loaded_items),
             'loaded_cycles': list(self.loaded_cycles),
             'memory_mb': round(mem_mb, 0),
             'loading': self._lock.locked(),
@@ -1312,7 +1376,7 @@ class CrossSectionManager:
 
     def _load_cycle_inner(self, cycle_key: str) -> dict:
         with self._lock:
-            cycle = next((c for c in self.available_cycles if c['cycle_key'] == cycle_key), None)
+            cycle = self._find_cycle(cycle_key)
             if not cycle:
                 return {'success': False, 'error': f'Cycle {cycle_key} not found'}
 
@@ -1352,7 +1416,7 @@ class CrossSectionManager:
             if prs_files and self.xsect.load_forecast_hour(str(prs_files[0]), engine_key):
                 with self._lock:
                     if (cycle_key, fhr) not in self.loaded_items:
-                        self.loaded_items.append((cycle_key, fhr))
+                        self.loaded_items[(cycle_key, fhr)] = None
                 return fhr, True
             return fhr, False
 
@@ -1403,7 +1467,7 @@ class CrossSectionManager:
             if (cycle_key, fhr) in self.loaded_items:
                 return {'success': True, 'already_loaded': True}
 
-            cycle = next((c for c in self.available_cycles if c['cycle_key'] == cycle_key), None)
+            cycle = self._find_cycle(cycle_key)
             if not cycle:
                 return {'success': False, 'error': f'Cycle {cycle_key} not found'}
 
@@ -1439,7 +1503,7 @@ class CrossSectionManager:
             load_time = time.time() - load_start
             with self._lock:
                 if (cycle_key, fhr) not in self.loaded_items:
-                    self.loaded_items.append((cycle_key, fhr))
+                    self.loaded_items[(cycle_key, fhr)] = None
                 self.current_cycle = cycle_key
             mem_mb = self.xsect.get_memory_usage()
             logger.info(f"Loaded {cycle_key} F{fhr:02d} in {load_time:.1f}s (Total: {mem_mb:.0f} MB)")
@@ -1468,7 +1532,7 @@ class CrossSectionManager:
                 return {'success': True, 'not_loaded': True}
 
             self._unload_item(cycle_key, fhr)
-            self.loaded_items.remove((cycle_key, fhr))
+            del self.loaded_items[(cycle_key, fhr)]
 
         mem_mb = self.xsect.get_memory_usage() if self.xsect else 0
         return {
@@ -1477,15 +1541,19 @@ class CrossSectionManager:
             'memory_mb': round(mem_mb, 0),
         }
 
-    def generate_cross_section(self, start, end, cycle_key, fhr, style, y_axis='pressure', vscale=1.0, y_top=100, units='km', terrain_data=None, temp_cmap='standard', anomaly=False):
-        """Generate a cross-section for a loaded forecast hour."""
+    def generate_cross_section(self, start, end, cycle_key, fhr, style, y_axis='pressure', vscale=1.0, y_top=100, units='km', terrain_data=None, temp_cmap='standard', anomaly=False, raw=False, terrain_out=None):
+        """Generate a cross-section for a loaded forecast hour.
+
+        Returns a PNG BytesIO, or an RGB PIL Image when raw=True. Pass a dict as
+        terrain_out to receive this frame's terrain for locking later frames.
+        """
         if not self.xsect:
             return None
 
         if (cycle_key, fhr) not in self.loaded_items:
             return None
 
-        cycle = next((c for c in self.available_cycles if c['cycle_key'] == cycle_key), None)
+        cycle = self._find_cycle(cycle_key)
         engine_key = self._engine_key_map.get((cycle_key, fhr))
         if engine_key is None:
             return None
@@ -1514,9 +1582,13 @@ class CrossSectionManager:
                 temp_cmap=temp_cmap,
                 metadata=meta,
                 anomaly=anomaly,
+                image_format='image' if raw else 'png',
+                terrain_out=terrain_out,
             )
             if png_bytes is None:
                 return None
+            if raw:
+                return png_bytes
             return io.BytesIO(png_bytes)
         except Exception as e:
             import traceback
@@ -1533,31 +1605,40 @@ class CrossSectionManager:
         fhr_data = self.xsect.forecast_hours.get(engine_key)
         if fhr_data is None:
             return None
+
+        # Terrain does not depend on style, and engine keys are unique per load,
+        # so GIF/prerender batches along the same path reuse one extraction.
+        cache_key = (engine_key, tuple(start), tuple(end))
+        with self._terrain_cache_lock:
+            cached = self._terrain_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         import numpy as np
-        # Adaptive n_points: ~1 per 3km, clamped [50, 1000]
-        lat1, lon1 = np.radians(start[0]), np.radians(start[1])
-        lat2, lon2 = np.radians(end[0]), np.radians(end[1])
-        dlat, dlon = lat2 - lat1, lon2 - lon1
-        a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
-        dist_km = 6371 * 2 * np.arcsin(np.sqrt(a))
-        n_points = int(np.clip(dist_km / 3.0, 50, 1000))
+        # Same path resolution as the render, so terrain lines up with the frames
+        n_points = self.xsect.adaptive_n_points(start, end)
         path_lats = np.linspace(start[0], end[0], n_points)
         path_lons = np.linspace(start[1], end[1], n_points)
         data = self.xsect._interpolate_to_path(fhr_data, path_lats, path_lons, style)
-        return {
+        terrain = {
             'surface_pressure': data.get('surface_pressure'),
             'surface_pressure_hires': data.get('surface_pressure_hires'),
             'distances_hires': data.get('distances_hires'),
             'pressure_levels': fhr_data.pressure_levels,
         }
+        with self._terrain_cache_lock:
+            self._terrain_cache[cache_key] = terrain
+            while len(self._terrain_cache) > self.TERRAIN_CACHE_MAX:
+                del self._terrain_cache[next(iter(self._terrain_cache))]
+        return terrain
 
     # Legacy compatibility methods
     def get_available_times(self):
         """Legacy: Return loaded times for old API."""
         from datetime import timedelta
         times = []
-        for cycle_key, fhr in self.loaded_items:
-            cycle = next((c for c in self.available_cycles if c['cycle_key'] == cycle_key), None)
+        for cycle_key, fhr in list(self.loaded_items):
+            cycle = self._find_cycle(cycle_key)
             if cycle:
                 valid_dt = cycle['init_dt'] + timedelta(hours=fhr)
                 times.append({
@@ -1636,6 +1717,17 @@ def get_manager_from_request() -> CrossSectionManager:
         return None
 
 
+def conditional_jsonify(payload):
+    """jsonify() with an ETag; a matching If-None-Match gets an empty 304.
+
+    For read-only listings that clients poll but that rarely change between
+    polls (cycles, products, climatology status).
+    """
+    response = jsonify(payload)
+    response.add_etag()
+    return response.make_conditional(request)
+
+
 # =============================================================================
 # HTML TEMPLATE
 # =============================================================================
@@ -2703,6 +2795,15 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
         // Model parameter helper — appends &model= to API calls
         function modelParam() { return `&model=${currentModel}`; }
 
+        // Encoded query string for the cross-section render endpoints
+        function xsectQuery(start, end, params) {
+            return new URLSearchParams({
+                start_lat: start.lat, start_lon: start.lng,
+                end_lat: end.lat, end_lon: end.lng,
+                ...params,
+            }).toString();
+        }
+
         // Load available models from server and populate dropdown
         async function loadModels() {
             try {
@@ -3814,17 +3915,42 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
 
                             // Fetch all frames as blob URLs
                             const style = body.style;
-                            const baseParams = `start_lat=${body.start[0]}&start_lon=${body.start[1]}&end_lat=${body.end[0]}&end_lon=${body.end[1]}&style=${style}&y_axis=${body.y_axis}&vscale=${body.vscale}&y_top=${body.y_top}&units=${body.units}&temp_cmap=${body.temp_cmap}&anomaly=${body.anomaly ? '1' : '0'}&model=${currentModel}`;
-
-                            for (const fhr of sorted) {
-                                try {
-                                    const fRes = await fetch(`/api/frame?cycle=${currentCycle}&fhr=${fhr}&${baseParams}`);
-                                    if (fRes.ok) {
-                                        const blob = await fRes.blob();
-                                        prerenderedFrames[fhr] = URL.createObjectURL(blob);
+                            const baseParams = xsectQuery(
+                                {lat: body.start[0], lng: body.start[1]}, {lat: body.end[0], lng: body.end[1]}, {
+                                    style, y_axis: body.y_axis, vscale: body.vscale, y_top: body.y_top, units: body.units,
+                                    temp_cmap: body.temp_cmap, anomaly: body.anomaly ? '1' : '0', model: currentModel,
+                                });
+
+                            // One batched request for everything the prerender cached
+                            try {
+                                const bRes = await fetch('/api/frames', {
+                                    method: 'POST',
+                                    headers: {'Content-Type': 'application/json'},
+                                    body: JSON.stringify(body),
+                                });
+                                if (bRes.ok) {
+                                    const batch = await bRes.json();
+                                    for (const [fhr, b64] of Object.entries(batch.frames || {})) {
+                                        prerenderedFrames[fhr] = `data:image/png;base64,${b64}`;
                                     }
-                                } catch (e) { /* skip failed frames */ }
-                            }
+                                }
+                            } catch (e) { /* fall back to per-frame fetches */ }
+
+                            // Fetch batch misses over a few parallel connections
+                            const missing = sorted.filter(fhr => !prerenderedFrames[fhr]);
+                            const fetchMissing = async () => {
+                                while (missing.length) {
+                                    const fhr = missing.shift();
+                                    try {
+                                        const fRes = await fetch(`/api/frame?cycle=${currentCycle}&fhr=${fhr}&${baseParams}`);
+                                        if (fRes.ok) {
+                                            const blob = await fRes.blob();
+                                            prerenderedFrames[fhr] = URL.createObjectURL(blob);
+                                        }
+                                    } catch (e) { /* skip failed frames */ }
+                                }
+                            };
+                            await Promise.all(Array.from({length: 4}, fetchMissing));
                             showToast(`${sorted.length} frames pre-rendered`, 'success');
                         }
                     } catch (e) {
@@ -4008,10 +4134,10 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             const tempCmap = document.getElementById('temp-cmap-select').value;
 
             // Use /api/frame for comparison (benefits from prerender cache)
-            const url = `/api/frame?start_lat=${start.lat}&start_lon=${start.lng}` +
-                `&end_lat=${end.lat}&end_lon=${end.lng}&cycle=${compareCycle}&fhr=${cFhr}&style=${style}` +
-                `&y_axis=${currentYAxis}&vscale=${vscale}&y_top=${ytop}&units=${units}&temp_cmap=${tempCmap}` +
-                `&anomaly=${anomalyMode ? 1 : 0}&model=${currentModel}`;
+            const url = '/api/frame?' + xsectQuery(start, end, {
+                cycle: compareCycle, fhr: cFhr, style, y_axis: currentYAxis, vscale, y_top: ytop,
+                units, temp_cmap: tempCmap, anomaly: anomalyMode ? 1 : 0, model: currentModel,
+            });
 
             try {
                 const res = await fetch(url);
@@ -4101,10 +4227,10 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             const units = document.getElementById('units-select').value;
 
             const tempCmap = document.getElementById('temp-cmap-select').value;
-            const url = `/api/xsect?start_lat=${start.lat}&start_lon=${start.lng}` +
-                `&end_lat=${end.lat}&end_lon=${end.lng}&cycle=${currentCycle}&fhr=${activeFhr}&style=${style}` +
-                `&y_axis=${currentYAxis}&vscale=${vscale}&y_top=${ytop}&units=${units}&temp_cmap=${tempCmap}` +
-                `&anomaly=${anomalyMode ? 1 : 0}${modelParam()}`;
+            const url = '/api/xsect?' + xsectQuery(start, end, {
+                cycle: currentCycle, fhr: activeFhr, style, y_axis: currentYAxis, vscale, y_top: ytop,
+                units, temp_cmap: tempCmap, anomaly: anomalyMode ? 1 : 0, model: currentModel,
+            });
 
             try {
                 const res = await fetch(url, { signal: xsectAbortController.signal });
@@ -4163,11 +4289,11 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             const ytop = document.getElementById('ytop-select').value;
             const units = document.getElementById('units-select').value;
             const speed = document.getElementById('gif-speed').value;
-            const url = `/api/xsect_gif?start_lat=${start.lat}&start_lon=${start.lng}` +
-                `&end_lat=${end.lat}&end_lon=${end.lng}&cycle=${currentCycle}&style=${style}` +
-                `&y_axis=${currentYAxis}&vscale=${vscale}&y_top=${ytop}&units=${units}&speed=${speed}` +
-                `&temp_cmap=${document.getElementById('temp-cmap-select').value}` +
-                `&anomaly=${anomalyMode ? 1 : 0}${modelParam()}` + adminParam();
+            const url = '/api/xsect_gif?' + xsectQuery(start, end, {
+                cycle: currentCycle, style, y_axis: currentYAxis, vscale, y_top: ytop, units, speed,
+                temp_cmap: document.getElementById('temp-cmap-select').value,
+                anomaly: anomalyMode ? 1 : 0, model: currentModel,
+            }) + adminParam();
             try {
                 const res = await fetch(url);
                 if (!res.ok) {
@@ -4426,7 +4552,7 @@ def api_models():
 def api_cycles():
     """Return available cycles for the dropdown. Supports ?model=hrrr."""
     mgr = get_manager_from_request() or data_manager
-    return jsonify({
+    return conditional_jsonify({
         'cycles': mgr.get_cycles_for_ui(),
         'model': mgr.model_name,
     })
@@ -4437,11 +4563,21 @@ def api_check_key():
     mgr = get_manager_from_request() or data_manager
     return jsonify({'valid': check_admin_key(), 'protected': list(mgr.get_protected_cycles())})
 
+# (climatology dir mtime, response body): the status only changes when climo
+# files are added or removed, which bumps the directory mtime
+_climo_status_cache = (None, None)
+
 @app.route('/api/climatology_status')
 def api_climatology_status():
     """Return climatology availability for anomaly mode."""
-    if not CLIMATOLOGY_DIR.exists():
+    global _climo_status_cache
+    try:
+        dir_mtime = CLIMATOLOGY_DIR.stat().st_mtime_ns
+    except OSError:
         return jsonify({'available': False})
+    cached_mtime, cached_body = _climo_status_cache
+    if cached_mtime == dir_mtime:
+        return conditional_jsonify(cached_body)
     # Scan for available climo files
     months = {}
     for npz in CLIMATOLOGY_DIR.glob('climo_*.npz'):
@@ -4454,11 +4590,13 @@ def api_climatology_status():
             months[month].add(init)
     # Convert sets to sorted lists
     months = {m: sorted(inits) for m, inits in sorted(months.items())}
-    return jsonify({
+    body = {
         'available': len(months) > 0,
         'months': months,
         'anomaly_styles': sorted(ANOMALY_STYLES),
-    })
+    }
+    _climo_status_cache = (dir_mtime, body)
+    return conditional_jsonify(body)
 
 @app.route('/api/status')
 def api_status():
@@ -4467,17 +4605,25 @@ def api_status():
     return jsonify(mgr.get_loaded_status())
 
 AUTO_UPDATE_STATUS_FILE = '/tmp/auto_update_status.json'
+_auto_update_status_cache = {'key': None, 'data': None}  # (mtime_ns, size) -> parsed dict
 
 def _read_auto_update_status():
-    """Read auto-update status file written by auto_update.py. Returns dict or None."""
+    """Read auto-update status file written by auto_update.py. Returns dict or None.
+
+    The parsed dict is reused while the file's mtime/size are unchanged, so
+    rapid /api/progress polling costs one stat() instead of read + parse.
+    """
     try:
-        import os
         stat = os.stat(AUTO_UPDATE_STATUS_FILE)
         # Skip if stale (>5 min old)
         if time.time() - stat.st_mtime > 300:
             return None
-        with open(AUTO_UPDATE_STATUS_FILE, 'r') as f:
-            return json.loads(f.read())
+        key = (stat.st_mtime_ns, stat.st_size)
+        cache = _auto_update_status_cache
+        if cache['key'] != key:
+            cache['data'] = json.loads(Path(AUTO_UPDATE_STATUS_FILE).read_text())
+            cache['key'] = key
+        return cache['data']
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return None
 
@@ -4688,10 +4834,20 @@ def api_xsect():
     if temp_cmap_param not in ('standard', 'green_purple', 'white_zero', 'nws_ndfd'):
         temp_cmap_param = 'standard'
     anomaly_param = request.args.get('anomaly', '0') == '1'
+    mgr = get_manager_from_request() or data_manager
+
+    # Same key space as /api/frame: re-requesting an identical view (toggling
+    # back to a style, revisiting a FHR) or one already prerendered skips the
+    # render entirely. New renders go to VIEW_CACHE, not the prerender cache.
+    cache_key = frame_cache_key(mgr.model_name, cycle_key, fhr, style, start, end, y_axis, vscale, y_top, dist_units, temp_cmap_param, anomaly_param)
+    cached = frame_cache_get(cache_key, VIEW_CACHE) or frame_cache_get(cache_key)
+    if cached:
+        touch_cycle_access(cycle_key)
+        return send_file(io.BytesIO(cached), mimetype='image/png')
+
     acquired = RENDER_SEMAPHORE.acquire(timeout=10)
     if not acquired:
         return jsonify({'error': 'Server busy, try again in a moment'}), 503
-    mgr = get_manager_from_request() or data_manager
     try:
         buf = mgr.generate_cross_section(start, end, cycle_key, fhr, style, y_axis, vscale, y_top, units=dist_units, temp_cmap=temp_cmap_param, anomaly=anomaly_param)
     finally:
@@ -4699,6 +4855,8 @@ def api_xsect():
     if buf is None:
         return jsonify({'error': 'Failed to generate cross-section. Data may not be loaded.'}), 500
 
+    frame_cache_put(cache_key, buf.getvalue(), VIEW_CACHE, MAX_VIEW_CACHE)
+    buf.seek(0)
     touch_cycle_access(cycle_key)
     return send_file(buf, mimetype='image/png')
 
@@ -4735,42 +4893,75 @@ def api_xsect_gif():
     mgr = get_manager_from_request() or data_manager
 
     # All loaded FHRs available for GIF (mmap makes loading all FHRs cheap)
-    loaded_fhrs = sorted(fhr for ck, fhr in mgr.loaded_items
+    loaded_fhrs = sorted(fhr for ck, fhr in list(mgr.loaded_items)
                          if ck == cycle_key)
     if len(loaded_fhrs) < 2:
         return jsonify({'error': f'Need at least 2 loaded FHRs for GIF (have {len(loaded_fhrs)})'}), 400
 
-    # Lock terrain to first FHR so elevation doesn't jitter between frames
-    terrain_data = mgr.get_terrain_data(start, end, cycle_key, loaded_fhrs[0], style)
+    # Lock terrain to first FHR so elevation doesn't jitter between frames.
+    # The first frame's own render fills it in (terrain_out), so there is no
+    # separate interpolation pass just to extract terrain.
+    terrain_data = {}
 
-    # GIF holds the semaphore for its entire render sequence (up to 19 frames)
-    sem_timeout = 90
-    acquired = RENDER_SEMAPHORE.acquire(timeout=sem_timeout)
-    if not acquired:
-        return jsonify({'error': 'Server busy, try again in a moment'}), 503
-    try:
-        frames = []
-        for fhr in loaded_fhrs:
-            buf = mgr.generate_cross_section(start, end, cycle_key, fhr, style, y_axis, vscale, y_top, units=dist_units, terrain_data=terrain_data, temp_cmap=gif_temp_cmap, anomaly=gif_anomaly)
-            if buf is not None:
-                frames.append(imageio.imread(buf))
-    finally:
-        RENDER_SEMAPHORE.release()
+    # Frames render in parallel (same pattern as prerender), so one GIF holds
+    # up to GIF_WORKERS RENDER_SEMAPHORE slots while it renders. Any frame that
+    # can't get a slot or fails to render fails the whole request: a loop with
+    # silently missing hours looks like valid data.
+    busy = threading.Event()    # A frame timed out waiting for a slot
+    failed = threading.Event()  # Any frame failed; remaining frames bail out
 
-    if len(frames) < 2:
-        return jsonify({'error': 'Failed to generate enough frames'}), 500
+    def render_frame(fhr, palette=None, terrain_out=None):
+        if failed.is_set():
+            return None
+        if not RENDER_SEMAPHORE.acquire(timeout=90):
+            busy.set()
+            failed.set()
+            return None
+        try:
+            # RGB image straight from the renderer: no PNG encode/decode
+            # round-trip. Palettize immediately so each held frame is 1 byte/pixel.
+            rgb = mgr.generate_cross_section(start, end, cycle_key, fhr, style, y_axis, vscale, y_top, units=dist_units,
+                                             terrain_data=None if terrain_out is not None else (terrain_data or None),
+                                             temp_cmap=gif_temp_cmap, anomaly=gif_anomaly, raw=True, terrain_out=terrain_out)
+            if rgb is None:
+                failed.set()
+                return None
+            if palette is None:
+                return rgb.quantize(colors=256)
+            return rgb.quantize(palette=palette, dither=Image.Dither.NONE)
+        finally:
+            RENDER_SEMAPHORE.release()
+
+    # The first frame's median-cut palette is reused for the rest: the colorbar
+    # shows the full colormap on every frame, so it covers them. Later frames
+    # skip median-cut, colors don't shimmer between frames, and the GIF
+    # carries one global color table instead of one per frame.
+    first = render_frame(loaded_fhrs[0], terrain_out=terrain_data)
+    frames = [first]
+    if first is not None:
+        rest = loaded_fhrs[1:]
+        with ThreadPoolExecutor(max_workers=min(GIF_WORKERS, len(rest))) as pool:
+            # map() keeps frames in FHR order
+            frames += pool.map(lambda fhr: render_frame(fhr, first), rest)
+
+    if busy.is_set():
+        return jsonify({'error': 'Server busy rendering, try again shortly'}), 503
+    missing = [fhr for fhr, f in zip(loaded_fhrs, frames) if f is None]
+    if missing:
+        return jsonify({'error': 'Failed to render ' + ', '.join(f'F{fhr:02d}' for fhr in missing)}), 500
 
     # Speed: 1x = 250ms (fast), 0.75x = 500ms, 0.5x = 1000ms, 0.25x = 2000ms
     SPEED_MS = {'1': 250, '0.75': 500, '0.5': 1000, '0.25': 2000}
     speed_key = request.args.get('speed', '0.5')
     frame_ms = SPEED_MS.get(speed_key, 1000)
 
-    # Use Pillow with disposal=2 (replace each frame) to prevent flickering on Discord
-    gif_buf = io.BytesIO()
-    pil_frames = [Image.fromarray(f) for f in frames]
-    pil_frames[0].save(
+    # Use Pillow with disposal=2 (replace each frame) to prevent flickering on Discord.
+    # Long loops run to tens of MB: spill past GIF_SPOOL_BYTES to a temp file
+    # instead of holding the whole encoded GIF in RAM while it is sent.
+    gif_buf = tempfile.SpooledTemporaryFile(max_size=GIF_SPOOL_BYTES)
+    frames[0].save(
         gif_buf, format='GIF', save_all=True,
-        append_images=pil_frames[1:],
+        append_images=frames[1:],
         duration=frame_ms, loop=0, disposal=2
     )
     gif_buf.seek(0)
@@ -4832,10 +5023,11 @@ def api_prerender():
         # Ensure all data is loaded first (sequential, fast from mmap cache)
         render_frames = []
         rendered = [0]  # mutable for closure
+        view_key = frame_view_key(style, start, end, y_axis, vscale, y_top, units, temp_cmap, anomaly)
         for frame in frames:
             ck = frame['cycle']
             fhr = int(frame['fhr'])
-            cache_key = frame_cache_key(model, ck, fhr, style, start, end, y_axis, vscale, y_top, units, temp_cmap, anomaly)
+            cache_key = frame_cache_key_for_view(model, ck, fhr, view_key)
 
             if frame_cache_get(cache_key) is not None:
                 rendered[0] += 1
@@ -4959,6 +5151,57 @@ def api_frame():
     return send_file(buf, mimetype='image/png')
 
 
+@app.route('/api/frames', methods=['POST'])
+@rate_limit
+def api_frames():
+    """Fetch many prerendered frames in one round-trip.
+
+    POST JSON: same shape as /api/prerender. Returns {frames: {fhr: base64 PNG}}
+    for every frame already in the prerender cache; misses are omitted so the
+    client can fall back to /api/frame for them.
+    """
+    data = request.get_json()
+    if not data:
+        return jsonify({'error': 'Missing JSON body'}), 400
+
+    try:
+        frames = data['frames']
+        if not isinstance(frames, list):
+            raise TypeError("'frames' must be a list")
+        start = tuple(data['start'])
+        end = tuple(data['end'])
+        vscale = float(data.get('vscale', 1.0))
+        y_top = int(data.get('y_top', 100))
+        wanted = [(str(frame['cycle']), int(frame['fhr'])) for frame in frames]
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({'error': f'Invalid parameters: {e}'}), 400
+    if len(wanted) > MAX_FRAMES_PER_FETCH:
+        return jsonify({'error': f'Too many frames (max {MAX_FRAMES_PER_FETCH} per request)'}), 400
+
+    style = data.get('style', 'temperature')
+    y_axis = data.get('y_axis', 'pressure')
+    units = data.get('units', 'km')
+    temp_cmap = data.get('temp_cmap', 'standard')
+    anomaly = bool(data.get('anomaly', False))
+    model = data.get('model', 'hrrr')
+
+    out = {}
+    try:
+        view_key = frame_view_key(style, start, end, y_axis, vscale, y_top, units, temp_cmap, anomaly)
+    except (IndexError, TypeError, ValueError) as e:
+        return jsonify({'error': f'Invalid parameters: {e}'}), 400
+    for cycle, fhr in wanted:
+        cache_key = frame_cache_key_for_view(model, cycle, fhr, view_key)
+        cached = frame_cache_get(cache_key)
+        if cached:
+            out[fhr] = base64.b64encode(cached).decode('ascii')
+
+    if orjson is not None:
+        return app.response_class(orjson.dumps({'frames': out}, option=orjson.OPT_NON_STR_KEYS),
+                                  mimetype='application/json')
+    return jsonify({'frames': out})
+
+
 # =============================================================================
 # v1 API — agent-friendly endpoints with smart defaults
 # =============================================================================
@@ -5046,8 +5289,8 @@ def api_v1_products():
     excluded = MODEL_EXCLUDED_STYLES.get(model, set())
     if excluded:
         filtered = [p for p in PRODUCTS_INFO if PRODUCT_TO_STYLE.get(p['id']) not in excluded]
-        return jsonify({'products': filtered, 'model': model})
-    return jsonify({'products': PRODUCTS_INFO, 'model': model})
+        return conditional_jsonify({'products': filtered, 'model': model})
+    return conditional_jsonify({'products': PRODUCTS_INFO, 'model': model})
 
 
 @app.route('/api/v1/cycles')
@@ -5055,6 +5298,7 @@ def api_v1_products():
 def api_v1_cycles():
     """List available cycles and their forecast hours."""
     mgr = get_manager_from_request() or data_manager
+    loaded_keys = {k for k, _ in list(mgr.loaded_items)}
     cycles_out = []
     for c in mgr.available_cycles:
         ck = c['cycle_key']
@@ -5062,10 +5306,10 @@ def api_v1_cycles():
             'key': ck,
             'display': c['display'],
             'forecast_hours': c['available_fhrs'],
-            'loaded': any(k == ck for k, _ in mgr.loaded_items),
+            'loaded': ck in loaded_keys,
         })
     latest = mgr.available_cycles[0]['cycle_key'] if mgr.available_cycles else None
-    return jsonify({'cycles': cycles_out, 'latest': latest, 'model': mgr.model_name})
+    return conditional_jsonify({'cycles': cycles_out, 'latest': latest, 'model': mgr.model_name})
 
 
 @app.route('/api/v1/status')
@@ -5357,6 +5601,15 @@ def main():
 
     data_manager = model_registry.get('hrrr')  # Keep backward compat alias
 
+    # Warm one-time render setup (shapefile parse, matplotlib import) off the request path.
+    # Started first so it overlaps the optional download and the cycle scans.
+    def _render_warmup():
+        from core.cross_section_interactive import InteractiveCrossSection
+        t0 = time.time()
+        InteractiveCrossSection.warmup()
+        logger.info(f"Render warmup done ({time.time() - t0:.1f}s)")
+    threading.Thread(target=_render_warmup, daemon=True).start()
+
     # Optionally download fresh data (HRRR only for now)
     if args.auto_update:
         from smart_hrrr.orchestrator import download_latest_cycle
@@ -5391,7 +5644,17 @@ def main():
     # Pre-load latest cycles in background so Flask starts immediately
     if args.preload > 0:
         def _startup_preload():
-            time.sleep(2)  # Let Flask bind first
+            # Let Flask bind first: poll the port with backoff rather than a fixed 2s sleep
+            import socket
+            probe_host = '127.0.0.1' if args.host in ('0.0.0.0', '') else args.host
+            delay, deadline = 0.05, time.monotonic() + 10
+            while time.monotonic() < deadline:
+                try:
+                    socket.create_connection((probe_host, args.port), timeout=0.5).close()
+                    break
+                except OSError:
+                    time.sleep(delay)
+                    delay = min(delay * 1.5, 2.0)
             # HRRR always loads first — it's the primary product
             ordered = sorted(model_registry.managers.items(),
                              key=lambda x: (0 if x[0] == 'hrrr' else 1, x[0]))